@@ -1,13 +1,23 @@
 """
 Módulo principal do pacote genetic.
+
+Os submódulos são importados sob demanda (PEP 562): ``import genetic`` não
+carrega as tabelas de trincas nem os operadores até que um dos nomes abaixo
+seja acessado.
 """
 
-from genetic.config import Config
-from genetic.individual import Individual
-from genetic.population import Population
-from genetic.crossover import Crossover
-from genetic.mutation import Mutation
-from genetic.selection import tournament_selection
+import importlib
+
+# Nome exportado -> submódulo que o define
+_LAZY = {
+    'Config': 'genetic.config',
+    'Individual': 'genetic.individual',
+    'Population': 'genetic.population',
+    'Crossover': 'genetic.crossover',
+    'Mutation': 'genetic.mutation',
+    'tournament_selection': 'genetic.selection',
+    'tournament_selection_pair': 'genetic.selection',
+}
 
 __all__ = [
     'Config',
@@ -15,5 +25,19 @@ __all__ = [
     'Population',
     'Crossover',
     'Mutation',
-    'tournament_selection'
-] 
+    'tournament_selection',
+    'tournament_selection_pair'
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    # Guarda no namespace do pacote para que os próximos acessos sejam diretos
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,7 +3,8 @@ Configurações do algoritmo genético para otimização de jogos da loteria.
 """
 
 import itertools
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 import random
 
 class Config:
@@ -19,7 +20,9 @@ class Config:
         crossover_rate=1.0,
         elite_size=5,
         games_multiplier=1.0,
-        fitness_weights=None
+        fitness_weights=None,
+        seed=None,
+        verbose=True
     ):
         """
         Inicializa a configuração com os parâmetros fornecidos.
@@ -32,6 +35,12 @@ class Config:
             elite_size: Número de melhores indivíduos preservados entre gerações
             games_multiplier: Multiplicador para o número de jogos
             fitness_weights: Pesos para diferentes componentes do fitness
+            seed: Semente dos geradores aleatórios da população e dos
+                operadores (opcional; se não for fornecida, é usado o gerador
+                global do módulo random). Com a mesma semente, a execução é
+                reproduzível independentemente do número de processos
+            verbose: Se True, exibe o progresso da inicialização e de cada
+                geração (desative em execuções de benchmark)
         """
         self.population_size = population_size
         self.max_generations = max_generations
@@ -39,6 +48,8 @@ class Config:
         self.crossover_rate = crossover_rate
         self.elite_size = elite_size
         self.games_multiplier = games_multiplier
+        self.seed = seed
+        self.verbose = verbose
         
         # Pesos padrão se não forem fornecidos
         if fitness_weights is None:
@@ -49,6 +60,41 @@ class Config:
         else:
             self.fitness_weights = fitness_weights
     
+    @property
+    def fitness_weights(self) -> Mapping[str, float]:
+        """
+        Pesos dos componentes do fitness (somente leitura).
+        
+        Os pesos são copiados para w_trincas e w_penalty na atribuição, então
+        alterá-los no lugar não teria efeito no fitness; por isso a visão não
+        aceita alterações. Para mudar os pesos, atribua um novo dicionário.
+        """
+        return self._fitness_weights
+    
+    @fitness_weights.setter
+    def fitness_weights(self, weights: Mapping[str, float]) -> None:
+        # Os pesos também ficam disponíveis como atributos simples, evitando a
+        # busca por chave no dicionário a cada cálculo de fitness
+        self._fitness_weights = MappingProxyType(dict(weights))
+        self.w_trincas = weights['trincas_coverage']
+        self.w_penalty = weights['games_penalty']
+    
+    def __getstate__(self) -> dict:
+        """
+        Estado usado na serialização (pickle) e em copy.copy.
+        
+        MappingProxyType não pode ser serializado, então os pesos são
+        guardados como um dicionário comum.
+        """
+        state = self.__dict__.copy()
+        state['_fitness_weights'] = dict(self._fitness_weights)
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        """Restaura o estado, recriando a visão somente leitura dos pesos."""
+        self.__dict__.update(state)
+        self._fitness_weights = MappingProxyType(self._fitness_weights)
+    
     def __str__(self):
         """
         Retorna uma representação em string da configuração.
@@ -2,11 +2,46 @@
 Módulo que implementa operadores de crossover para o algoritmo genético.
 """
 
+import heapq
+import os
 import random
-from typing import Tuple, List, Set, Dict, Optional
+from collections import Counter
+from typing import Tuple, List, Set, Dict, FrozenSet, Optional
 
-from genetic.individual import Individual, calculate_fitness
+from genetic.individual import Individual, calculate_fitness_batch
 from genetic.config import Config
+from genetic.workers import WorkerPool, with_rng, worker_operator
+from genetic.trincas import (
+    ALL_TRINCA_IDS,
+    ALL_TRINCAS_MASK,
+    game_to_mask,
+    mask_to_trinca_ids,
+    popcount,
+)
+
+# Todas as trincas possíveis, calculadas uma única vez na importação e
+# compartilhadas por todas as instâncias de Crossover
+_ALL_TRINCAS: FrozenSet[int] = ALL_TRINCA_IDS
+
+# Número de trincas em comum entre dois jogos que compartilham k números (C(k, 3))
+_SHARED_TRINCAS = (0, 0, 0, 1, 4, 10, 20)
+
+# Abaixo deste número de pares o custo de criar processos e serializar os
+# indivíduos supera o ganho do paralelismo em crossover_batch
+MIN_PARALLEL_PAIRS = 16
+
+def _crossover_seeded(crossover: 'Crossover',
+                      task: Tuple[str, int, Individual, Individual]) -> Tuple[Individual, Individual]:
+    """Aplica o operador de crossover indicado a um par de pais a partir da semente da tarefa."""
+    method, seed, parent1, parent2 = task
+    # Cada tarefa tem sua própria semente, sorteada no processo principal, para
+    # que o resultado não dependa de qual processo executa qual par
+    return getattr(with_rng(crossover, random.Random(seed)), method)(parent1, parent2)
+
+
+def _crossover_pair(task: Tuple[str, int, Individual, Individual]) -> Tuple[Individual, Individual]:
+    """Aplica o operador de crossover indicado a um par de pais no processo de trabalho."""
+    return _crossover_seeded(worker_operator(Crossover), task)
 
 
 class Crossover:
@@ -20,25 +55,41 @@ class Crossover:
             config: Configurações do algoritmo genético.
         """
         self.config = config
-        self._all_possible_trincas = self._generate_all_possible_trincas()
+        # Gerador aleatório próprio quando há semente na configuração; caso
+        # contrário, usa o gerador global do módulo random
+        self.rng = random if config.seed is None else random.Random(config.seed)
+        self._all_possible_trincas = _ALL_TRINCAS
         self.max_attempts = 100  # Limite máximo de tentativas de troca
         self.max_redundant_games = 1000  # Limite máximo de jogos redundantes a considerar
+        # Pool de processos de crossover_batch, criado no primeiro lote
+        # paralelo e reaproveitado nos seguintes
+        self._pool = WorkerPool(config, (Crossover,))
     
-    def _generate_all_possible_trincas(self) -> Set[Tuple[int, int, int]]:
-        """Gera todas as trincas possíveis para os números de 1 a 60."""
-        trincas = set()
-        for i in range(1, 61):
-            for j in range(i + 1, 61):
-                for k in range(j + 1, 61):
-                    trincas.add((i, j, k))
-        return trincas
+    def _generate_all_possible_trincas(self) -> FrozenSet[int]:
+        """Retorna os identificadores de todas as trincas possíveis para os números de 1 a 60."""
+        return _ALL_TRINCAS
     
-    def _get_missing_trincas(self, individual: Individual) -> Set[Tuple[int, int, int]]:
+    def _get_missing_trincas(self, individual: Individual) -> Set[int]:
         """Retorna o conjunto de trincas que faltam no indivíduo."""
-        return self._all_possible_trincas - individual.trincas
+        return set(mask_to_trinca_ids(ALL_TRINCAS_MASK & ~individual.trincas_mask))
+    
+    def _copy_parents(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
+        """
+        Cria os filhos como cópias dos pais. Como os filhos recebem jogos um do
+        outro, cada um também herda o cache de trincas do outro pai.
+        """
+        child1 = parent1.copy()
+        child2 = parent2.copy()
+        child1.merge_trinca_cache(parent2)
+        child2.merge_trinca_cache(parent1)
+        return child1, child2
     
-    def _remove_duplicate_games(self, individual: Individual) -> None:
-        """Remove jogos duplicados de um indivíduo."""
+    def _remove_duplicate_games(self, individual: Individual) -> int:
+        """Remove jogos duplicados de um indivíduo e retorna quantos foram removidos."""
+        # Caso comum: nenhum jogo repetido, verificado inteiramente em C
+        if len(set(map(tuple, individual.games))) == len(individual.games):
+            return 0
+        
         unique_games = set()
         unique_games_list = []
         
@@ -48,7 +99,23 @@ class Crossover:
                 unique_games.add(game_tuple)
                 unique_games_list.append(game)
         
+        removed = len(individual.games) - len(unique_games_list)
         individual.games = unique_games_list
+        return removed
+    
+    def _remove_random_games(self, games: List[List[int]], count: int) -> None:
+        """
+        Remove jogos aleatórios da lista, cada um em O(1).
+        
+        Os índices são sorteados de uma só vez e processados do maior para o
+        menor: cada jogo sorteado é trocado com o último e removido com pop(),
+        evitando o deslocamento dos elementos seguintes que um del causaria. A
+        ordem dos jogos restantes não é preservada.
+        """
+        count = min(count, len(games))
+        for idx in sorted(self.rng.sample(range(len(games)), count), reverse=True):
+            games[idx], games[-1] = games[-1], games[idx]
+            games.pop()
     
     def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         """
@@ -62,20 +129,19 @@ class Crossover:
             Tuple[Individual, Individual]: Dois indivíduos filhos.
         """
         # Se não realizar crossover, retorna cópias dos pais
-        if random.random() > self.config.crossover_rate:
+        if self.rng.random() > self.config.crossover_rate:
             return parent1.copy(), parent2.copy()
         
         # Cria os filhos como cópias dos pais
-        child1 = parent1.copy()
-        child2 = parent2.copy()
+        child1, child2 = self._copy_parents(parent1, parent2)
         
         # Seleciona aleatoriamente jogos para trocar
         num_games_to_swap = min(len(parent1.games), len(parent2.games)) // 3
         
         if num_games_to_swap > 0:
             # Seleciona índices aleatórios para trocar
-            indices1 = random.sample(range(len(parent1.games)), num_games_to_swap)
-            indices2 = random.sample(range(len(parent2.games)), num_games_to_swap)
+            indices1 = self.rng.sample(range(len(parent1.games)), num_games_to_swap)
+            indices2 = self.rng.sample(range(len(parent2.games)), num_games_to_swap)
             
             # Realiza as trocas
             for idx1, idx2 in zip(indices1, indices2):
@@ -91,46 +157,85 @@ class Crossover:
         
         return child1, child2
     
+    def crossover_batch(self, pairs: List[Tuple[Individual, Individual]],
+                        method: str = 'crossover',
+                        max_workers: Optional[int] = None) -> List[Tuple[Individual, Individual]]:
+        """
+        Aplica um operador de crossover a vários pares de pais em paralelo.
+        
+        Cada par é independente dos demais, então os pares são distribuídos
+        entre processos de trabalho. Lotes pequenos (menos de
+        MIN_PARALLEL_PAIRS pares) ou com um único processo são executados
+        sequencialmente no processo atual. Cada par recebe uma semente do
+        gerador do operador nos dois casos, então o resultado é o mesmo com
+        qualquer número de processos.
+        
+        O pool de processos é mantido entre chamadas; encerre-o com close().
+        
+        Em plataformas que iniciam processos com 'spawn' (Windows, macOS), o
+        script que chama este método deve estar protegido por
+        ``if __name__ == '__main__':``.
+        
+        Args:
+            pairs: Lista de pares (parent1, parent2).
+            method: Nome do operador de crossover a aplicar (por exemplo,
+                'crossover' ou 'crossover_by_redundancy').
+            max_workers: Número de processos (padrão: os.cpu_count()).
+            
+        Returns:
+            Lista de pares (child1, child2), na mesma ordem dos pares de entrada.
+        """
+        getattr(self, method)  # Falha já aqui se o operador não existir
+        n_workers = max_workers or os.cpu_count() or 1
+        tasks = [(method, self.rng.getrandbits(64), parent1, parent2) for parent1, parent2 in pairs]
+        
+        if len(tasks) < MIN_PARALLEL_PAIRS or n_workers < 2:
+            return [_crossover_seeded(self, task) for task in tasks]
+        
+        chunksize = max(1, len(tasks) // (4 * n_workers))
+        executor = self._pool.get(n_workers)
+        return list(executor.map(_crossover_pair, tasks, chunksize=chunksize))
+    
+    def close(self) -> None:
+        """
+        Encerra o pool de processos de crossover_batch, se existir.
+        
+        O operador também pode ser usado num bloco with, que chama close()
+        ao sair.
+        """
+        self._pool.close()
+    
+    def __enter__(self) -> 'Crossover':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def crossover_by_trincas(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         """
         Implementa um operador de crossover que considera as trincas dos pais.
         """
         # Cria os filhos como cópias dos pais
-        child1 = parent1.copy()
-        child2 = parent2.copy()
+        child1, child2 = self._copy_parents(parent1, parent2)
         
         # Se algum pai não tem jogos, retorna cópias diretas
         if not parent1.games or not parent2.games:
             return child1, child2
         
-        # Identifica jogos que cobrem trincas únicas em cada pai
-        unique_trincas1 = parent1.trincas - parent2.trincas
-        unique_trincas2 = parent2.trincas - parent1.trincas
+        # Identifica trincas únicas de cada pai (bitsets)
+        unique_trincas1 = parent1.trincas_mask & ~parent2.trincas_mask
+        unique_trincas2 = parent2.trincas_mask & ~parent1.trincas_mask
         
         # Seleciona jogos que cobrem trincas únicas
         good_games1 = []
         good_games2 = []
         
         for game in parent1.games:
-            game_trincas = set()
-            for i in range(len(game)-2):
-                for j in range(i+1, len(game)-1):
-                    for k in range(j+1, len(game)):
-                        trinca = tuple(sorted((game[i], game[j], game[k])))
-                        if trinca in unique_trincas1:
-                            game_trincas.add(trinca)
-            if game_trincas:
+            if parent1.get_game_mask(game) & unique_trincas1:
                 good_games1.append(game)
                 
         for game in parent2.games:
-            game_trincas = set()
-            for i in range(len(game)-2):
-                for j in range(i+1, len(game)-1):
-                    for k in range(j+1, len(game)):
-                        trinca = tuple(sorted((game[i], game[j], game[k])))
-                        if trinca in unique_trincas2:
-                            game_trincas.add(trinca)
-            if game_trincas:
+            if parent2.get_game_mask(game) & unique_trincas2:
                 good_games2.append(game)
         
         # Troca uma proporção dos melhores jogos entre os filhos
@@ -138,15 +243,12 @@ class Crossover:
         
         if num_games_to_swap > 0:
             # Remove alguns jogos aleatórios para dar espaço aos novos
-            for _ in range(num_games_to_swap):
-                if child1.games:
-                    del child1.games[random.randint(0, len(child1.games)-1)]
-                if child2.games:
-                    del child2.games[random.randint(0, len(child2.games)-1)]
+            self._remove_random_games(child1.games, num_games_to_swap)
+            self._remove_random_games(child2.games, num_games_to_swap)
             
             # Adiciona os melhores jogos do outro pai
-            child1.games.extend(random.sample(good_games2, num_games_to_swap))
-            child2.games.extend(random.sample(good_games1, num_games_to_swap))
+            child1.games.extend(self.rng.sample(good_games2, num_games_to_swap))
+            child2.games.extend(self.rng.sample(good_games1, num_games_to_swap))
         
         # Remove jogos duplicados
         self._remove_duplicate_games(child1)
@@ -158,41 +260,32 @@ class Crossover:
         
         return child1, child2
     
-    def _get_game_trincas(self, game: List[int]) -> Set[Tuple[int, int, int]]:
-        """Retorna o conjunto de trincas de um jogo."""
-        trincas = set()
-        for i in range(len(game)):
-            for j in range(i + 1, len(game)):
-                for k in range(j + 1, len(game)):
-                    trincas.add(tuple(sorted([game[i], game[j], game[k]])))
-        return trincas
+    def _get_game_trincas(self, individual: Individual, game_idx: int) -> FrozenSet[int]:
+        """Retorna os identificadores das trincas de um jogo, usando o cache do indivíduo."""
+        return individual.get_game_trincas(individual.games[game_idx])
     
-    def _find_redundant_games(self, individual: Individual) -> List[Tuple[int, List[Tuple[int, int, int]]]]:
+    def _count_trincas(self, individual: Individual) -> Counter:
+        """Retorna quantos jogos do indivíduo cobrem cada trinca."""
+        return individual.get_trinca_counts()
+    
+    def _find_redundant_games(self, individual: Individual) -> Tuple[List[Tuple[int, List[int]]], Counter]:
         """
         Encontra jogos com trincas redundantes de forma otimizada.
-        Retorna uma lista de tuplas (índice_do_jogo, trincas_redundantes).
+        Retorna uma lista de tuplas (índice_do_jogo, trincas_redundantes) e a
+        contagem de jogos por trinca, que pode ser reaproveitada por
+        _calculate_coverage_balance.
         """
         redundant_games = []
-        trincas_to_games = {}  # Mapeia trincas para jogos que as contêm
         
-        # Primeira passagem: mapeia trincas para jogos
-        for game_idx, game in enumerate(individual.games):
-            game_trincas = self._get_game_trincas(game)
-            for trinca in game_trincas:
-                if trinca not in trincas_to_games:
-                    trincas_to_games[trinca] = []
-                trincas_to_games[trinca].append(game_idx)
+        # Primeira passagem: conta quantos jogos cobrem cada trinca
+        trinca_counts = self._count_trincas(individual)
         
         # Segunda passagem: identifica jogos redundantes
+        get_game_trincas = individual.get_game_trincas
         for game_idx, game in enumerate(individual.games):
-            game_trincas = self._get_game_trincas(game)
-            redundant_trincas = []
-            
-            # Verifica cada trinca do jogo
-            for trinca in game_trincas:
-                # Se a trinca aparece em mais de um jogo, é redundante
-                if len(trincas_to_games[trinca]) > 1:
-                    redundant_trincas.append(trinca)
+            # Se a trinca aparece em mais de um jogo, é redundante
+            redundant_trincas = [trinca for trinca in get_game_trincas(game)
+                                 if trinca_counts[trinca] > 1]
             
             if redundant_trincas:
                 redundant_games.append((game_idx, redundant_trincas))
@@ -201,11 +294,15 @@ class Crossover:
             if len(redundant_games) >= self.max_redundant_games:
                 break
         
-        # Ordena por número de trincas redundantes (mais redundantes primeiro)
-        redundant_games.sort(key=lambda x: len(x[1]), reverse=True)
-        return redundant_games
+        # Seleciona os jogos mais redundantes primeiro. crossover_by_redundancy
+        # consome no máximo um jogo por tentativa, então basta manter os
+        # max_attempts primeiros (mesma ordem de uma ordenação estável)
+        redundant_games = heapq.nlargest(self.max_attempts, redundant_games,
+                                         key=lambda x: len(x[1]))
+        return redundant_games, trinca_counts
     
-    def _calculate_coverage_balance(self, parent1, parent2, game1_idx, game2_idx):
+    def _calculate_coverage_balance(self, parent1, parent2, game1_idx, game2_idx,
+                                    trinca_counts1=None, trinca_counts2=None):
         """Calcula o impacto da troca de jogos entre os pais.
         
         Args:
@@ -213,6 +310,9 @@ class Crossover:
             parent2: Segundo indivíduo pai
             game1_idx: Índice do jogo no primeiro pai
             game2_idx: Índice do jogo no segundo pai
+            trinca_counts1: Contagem de jogos por trinca do primeiro pai (opcional,
+                obtida do indivíduo se não for fornecida)
+            trinca_counts2: Contagem de jogos por trinca do segundo pai (opcional)
             
         Returns:
             dict: Dicionário com o saldo de cobertura para cada pai
@@ -230,36 +330,25 @@ class Crossover:
                 }
         """
         # Gera as trincas dos jogos que serão trocados
-        game1 = parent1.games[game1_idx]
-        game2 = parent2.games[game2_idx]
-        game1_trincas = self._get_game_trincas(game1)
-        game2_trincas = self._get_game_trincas(game2)
-        
-        # Mapeia todas as trincas dos outros jogos (exceto os que serão trocados)
-        trincas_to_games1 = {}
-        trincas_to_games2 = {}
-        
-        # Para parent1 (exceto jogo1)
-        for i, game in enumerate(parent1.games):
-            if i != game1_idx:
-                for trinca in self._get_game_trincas(game):
-                    trincas_to_games1[trinca] = i
-        
-        # Para parent2 (exceto jogo2)
-        for i, game in enumerate(parent2.games):
-            if i != game2_idx:
-                for trinca in self._get_game_trincas(game):
-                    trincas_to_games2[trinca] = i
-        
-        # Identifica trincas únicas que serão perdidas
+        game1_trincas = self._get_game_trincas(parent1, game1_idx)
+        game2_trincas = self._get_game_trincas(parent2, game2_idx)
+        
+        # Conta os jogos que cobrem cada trinca (apenas se não foi fornecido)
+        if trinca_counts1 is None:
+            trinca_counts1 = self._count_trincas(parent1)
+        if trinca_counts2 is None:
+            trinca_counts2 = self._count_trincas(parent2)
+        
+        # Identifica trincas únicas que serão perdidas (cobertas apenas pelo jogo trocado)
         unique_trincas1 = {trinca for trinca in game1_trincas 
-                         if trinca not in trincas_to_games1}
+                         if trinca_counts1[trinca] == 1}
         unique_trincas2 = {trinca for trinca in game2_trincas 
-                         if trinca not in trincas_to_games2}
+                         if trinca_counts2[trinca] == 1}
         
-        # Calcula novas trincas que serão ganhas
-        new_trincas1 = game2_trincas - parent1.trincas  # novas trincas que jogo2 trará para parent1
-        new_trincas2 = game1_trincas - parent2.trincas  # novas trincas que jogo1 trará para parent2
+        # Calcula novas trincas que serão ganhas (as chaves das contagens são
+        # exatamente as trincas cobertas por cada pai)
+        new_trincas1 = {trinca for trinca in game2_trincas if trinca not in trinca_counts1}  # novas trincas que jogo2 trará para parent1
+        new_trincas2 = {trinca for trinca in game1_trincas if trinca not in trinca_counts2}  # novas trincas que jogo1 trará para parent2
         
         # Calcula o saldo para cada pai
         parent1_balance = len(new_trincas1) - len(unique_trincas1)
@@ -321,8 +410,27 @@ class Crossover:
         best_balance = -float('inf')
         best_candidate = -1
         
+        # Os mapeamentos não dependem do candidato, então são construídos uma vez
+        trinca_counts1 = self._count_trincas(parent1)
+        trinca_counts2 = self._count_trincas(parent2)
+        
+        # Limite superior do saldo total: o primeiro pai perde sempre as mesmas
+        # trincas únicas e cada pai ganha no máximo as trincas do jogo recebido
+        game1_trincas = self._get_game_trincas(parent1, game1_idx)
+        lost1 = sum(1 for trinca in game1_trincas if trinca_counts1[trinca] == 1)
+        max_balance = 2 * len(game1_trincas) - lost1
+        mask1 = game_to_mask(parent1.games[game1_idx])
+        
         for game2_idx in redundant_games2:
-            coverage_balance = self._calculate_coverage_balance(parent1, parent2, game1_idx, game2_idx)
+            # Trincas em comum entre os dois jogos não são ganho para nenhum pai;
+            # se nem o limite superior supera o melhor saldo, o candidato é ignorado
+            shared = _SHARED_TRINCAS[popcount(mask1 & game_to_mask(parent2.games[game2_idx]))]
+            if max_balance - 2 * shared <= best_balance:
+                continue
+            
+            coverage_balance = self._calculate_coverage_balance(
+                parent1, parent2, game1_idx, game2_idx, trinca_counts1, trinca_counts2
+            )
             
             # Calcula o saldo total considerando ambos os pais
             total_balance = coverage_balance['parent1']['balance'] + coverage_balance['parent2']['balance']
@@ -330,17 +438,28 @@ class Crossover:
             if total_balance > best_balance:
                 best_balance = total_balance
                 best_candidate = game2_idx
+                # Nenhum candidato seguinte pode superar o limite superior
+                if best_balance >= max_balance:
+                    break
         
         return best_candidate
     
+    def _swap_indexed_games(self, child1: Individual, child2: Individual,
+                            game1_idx: int, game2_idx: int) -> None:
+        """
+        Troca os jogos entre os filhos mantendo trincas e contagens atualizadas.
+        """
+        game1, game2 = child1.games[game1_idx], child2.games[game2_idx]
+        child1.swap_game(game1_idx, game2)
+        child2.swap_game(game2_idx, game1)
+    
     def _perform_swap(self, parent1: Individual, parent2: Individual, 
                      game1_idx: int, game2_idx: int) -> Tuple[Individual, Individual]:
         """
         Realiza a troca dos jogos entre os pais.
         """
         # Cria cópias dos pais
-        child1 = parent1.copy()
-        child2 = parent2.copy()
+        child1, child2 = self._copy_parents(parent1, parent2)
         
         # Realiza a troca
         child1.games[game1_idx], child2.games[game2_idx] = child2.games[game2_idx], child1.games[game1_idx]
@@ -372,16 +491,15 @@ class Crossover:
         Implementa um operador de crossover que troca jogos com trincas redundantes entre os pais.
         """
         # Cria os filhos como cópias dos pais
-        child1 = parent1.copy()
-        child2 = parent2.copy()
+        child1, child2 = self._copy_parents(parent1, parent2)
         
         # Se algum pai não tem jogos, retorna cópias diretas
         if not parent1.games or not parent2.games:
             return child1, child2
         
         # Encontra jogos com trincas redundantes em cada pai
-        redundant_games1 = self._find_redundant_games(child1)
-        redundant_games2 = self._find_redundant_games(child2)
+        redundant_games1, trinca_counts1 = self._find_redundant_games(child1)
+        redundant_games2, trinca_counts2 = self._find_redundant_games(child2)
         
         # print(f"\nCrossover por Redundância:")
         # print(f"Jogos redundantes encontrados: {len(redundant_games1)} em parent1, {len(redundant_games2)} em parent2")
@@ -403,38 +521,19 @@ class Crossover:
             # print(f"\nTentando trocar jogo {game1_idx} ({len(redundant_games1[0][1])} redundâncias) com {game2_idx}")
             
             # Calcula o impacto da troca
-            impact = self._calculate_coverage_balance(child1, child2, game1_idx, game2_idx)
+            impact = self._calculate_coverage_balance(
+                child1, child2, game1_idx, game2_idx, trinca_counts1, trinca_counts2
+            )
             
             # print(f"Impacto no parent1: perde {impact['parent1']['lost']} trincas únicas, ganha {impact['parent1']['gained']} novas trincas (saldo: {impact['parent1']['balance']})")
             # print(f"Impacto no parent2: perde {impact['parent2']['lost']} trincas únicas, ganha {impact['parent2']['gained']} novas trincas (saldo: {impact['parent2']['balance']})")
             
-            # Realiza a troca se houver benefício
-            if impact['parent1']['balance'] > 0 and impact['parent2']['balance'] > 0:
-                child1.games[game1_idx], child2.games[game2_idx] = child2.games[game2_idx], child1.games[game1_idx]
-                # print("Troca realizada em ambos os pais!")
+            # Realiza a troca se houver benefício para ao menos um dos pais.
+            # As trincas dos filhos são atualizadas de forma incremental a cada
+            # troca; o fitness só é recalculado ao final do loop.
+            if impact['parent1']['balance'] > 0 or impact['parent2']['balance'] > 0:
+                self._swap_indexed_games(child1, child2, game1_idx, game2_idx)
                 successful_swaps += 1
-                # Recalcula trincas e fitness após a troca
-                child1.calculate_trincas()
-                child2.calculate_trincas()
-                child1.fitness = calculate_fitness(child1)
-                child2.fitness = calculate_fitness(child2)
-            elif impact['parent1']['balance'] > 0:
-                child1.games[game1_idx], child2.games[game2_idx] = child2.games[game2_idx], child1.games[game1_idx]
-                # print("Troca realizada apenas no parent1!")
-                successful_swaps += 1
-                # Recalcula trincas e fitness após a troca
-                child1.calculate_trincas()
-                child1.fitness = calculate_fitness(child1)
-            elif impact['parent2']['balance'] > 0:
-                child1.games[game1_idx], child2.games[game2_idx] = child2.games[game2_idx], child1.games[game1_idx]
-                # print("Troca realizada apenas no parent2!")
-                successful_swaps += 1
-                # Recalcula trincas e fitness após a troca
-                child2.calculate_trincas()
-                child2.fitness = calculate_fitness(child2)
-            else:
-                # print("Troca não benéfica para nenhum pai!")
-                pass
             
             # Remove os jogos trocados da lista de redundantes
             redundant_games1 = redundant_games1[1:]
@@ -442,15 +541,15 @@ class Crossover:
         
         # print(f"\nResultado final: {successful_swaps} trocas benéficas realizadas em {attempts} tentativas")
         
-        # Remove jogos duplicados
-        self._remove_duplicate_games(child1)
-        self._remove_duplicate_games(child2)
+        # Remove jogos duplicados. As trocas já mantiveram as trincas dos filhos
+        # atualizadas (swap_game), então só é preciso recalculá-las se algum
+        # jogo saiu.
+        for child in (child1, child2):
+            if self._remove_duplicate_games(child):
+                child.calculate_trincas()
         
-        # Recalcula trincas e fitness uma última vez
-        child1.calculate_trincas()
-        child2.calculate_trincas()
-        child1.fitness = calculate_fitness(child1)
-        child2.fitness = calculate_fitness(child2)
+        # Recalcula o fitness uma última vez
+        calculate_fitness_batch([child1, child2])
         
         # Imprime resumo comparativo
         # self._print_crossover_summary(parent1, parent2, child1, child2)
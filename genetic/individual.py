@@ -3,12 +3,39 @@ Representa um indivíduo (solução candidata) para o algoritmo genético.
 """
 
 import random
-from typing import List, Set, Tuple, Optional
+from collections import Counter
+from typing import Dict, FrozenSet, List, Set, Tuple, Optional
 import itertools
 import time
 
 from genetic.config import Config
-from genetic.trincas import extract_trincas_from_game, extract_trincas_from_games, generate_all_trincas, TRINCAS
+from genetic.trincas import (
+    extract_trinca_ids_from_game,
+    trinca_ids_to_mask,
+    mask_to_trinca_ids,
+    popcount,
+    ALL_TRINCA_IDS,
+    ALL_TRINCAS_MASK,
+    TRINCAS_BY_ID,
+    TOTAL_TRINCAS,
+)
+
+# Faixas de números usadas na geração de jogos aleatórios
+_LOW_RANGE = range(1, 21)     # 1-20
+_MID_RANGE = range(21, 41)    # 21-40
+_HIGH_RANGE = range(41, 61)   # 41-60
+_ALL_NUMBERS = range(1, 61)   # 1-60
+
+# Quantos números de cada faixa (baixa, média, alta) um jogo aleatório tem: de
+# 1 a 3 números baixos e de 1 a 3 altos, independentes e equiprováveis
+_RANGE_SPLITS = [(low, 6 - low - high, high) for low in (1, 2, 3) for high in (1, 2, 3)]
+
+# Todas as combinações de k números de cada faixa (k de 0 a 4), já ordenadas.
+# Sortear uma combinação equivale a sortear k números sem repetição, mas com
+# uma única chamada ao gerador aleatório.
+_LOW_COMBOS = [list(itertools.combinations(_LOW_RANGE, k)) for k in range(5)]
+_MID_COMBOS = [list(itertools.combinations(_MID_RANGE, k)) for k in range(5)]
+_HIGH_COMBOS = [list(itertools.combinations(_HIGH_RANGE, k)) for k in range(5)]
 
 def calculate_fitness(individual: 'Individual') -> float:
     """
@@ -25,14 +52,14 @@ def calculate_fitness(individual: 'Individual') -> float:
         Valor de fitness calculado.
     """
     # Extrai pesos da configuração
-    weights = individual.config.fitness_weights
+    config = individual.config
     
     # Componente principal: cobertura de trincas (quanto maior, melhor)
-    trincas_coverage = len(individual.trincas)
-    trincas_coverage_score = trincas_coverage * weights['trincas_coverage']
+    trincas_coverage = popcount(individual.trincas_mask)
+    trincas_coverage_score = trincas_coverage * config.w_trincas
     
     # Componente secundário: penalidade pelo número de jogos (quanto menos jogos, melhor)
-    games_penalty = len(individual.games) * weights['games_penalty']
+    games_penalty = len(individual.games) * config.w_penalty
     
     # Fitness final: componente principal - penalidade secundária
     # A ordem de magnitude dos pesos garante que maximizar trincas é sempre
@@ -44,38 +71,128 @@ def calculate_fitness(individual: 'Individual') -> float:
     
     return fitness
 
+def calculate_fitness_batch(individuals: List['Individual']) -> List[float]:
+    """
+    Calcula o fitness de vários indivíduos de uma só vez.
+    
+    Equivale a chamar calculate_fitness para cada indivíduo, mas os pesos
+    só são lidos da configuração quando ela muda entre indivíduos
+    consecutivos (normalmente, uma única vez).
+    
+    Args:
+        individuals: Indivíduos a terem seu fitness calculado.
+        
+    Returns:
+        Lista com os valores de fitness, na mesma ordem dos indivíduos.
+    """
+    fitnesses = []
+    config = None
+    for individual in individuals:
+        if individual.config is not config:
+            config = individual.config
+            coverage_weight = config.w_trincas
+            games_weight = config.w_penalty
+        
+        fitness = popcount(individual.trincas_mask) * coverage_weight - len(individual.games) * games_weight
+        individual.fitness = fitness
+        fitnesses.append(fitness)
+    
+    return fitnesses
+
 class Individual:
     """
     Representa uma solução candidata (um conjunto de jogos).
     """
     
-    # Variável de classe para armazenar todas as trincas possíveis
-    all_trincas = generate_all_trincas()
+    # Variável de classe com os identificadores de todas as trincas possíveis
+    all_trincas = ALL_TRINCA_IDS
     
-    def __init__(self, config: Config = None, jogos: List[List[int]] = None, trincas: Set[Tuple[int, int, int]] = None, creation_method: str = None):
+    def __init__(self, config: Config = None, jogos: List[List[int]] = None, trincas: Set[int] = None, creation_method: str = None):
         """
         Inicializa um indivíduo com a configuração dada.
         
         Args:
             config: Configuração do algoritmo.
             jogos: Lista de jogos (opcional).
-            trincas: Conjunto de trincas (opcional).
+            trincas: Conjunto de identificadores de trincas (opcional).
             creation_method: Método de criação do indivíduo (opcional).
         """
         self.config = config
         self.games = jogos or []
-        self.trincas = trincas or set()
-        self.trincas_list = []
+        # Trincas cobertas como bitset: o bit i indica a trinca de identificador i
+        self.trincas_mask = trinca_ids_to_mask(trincas) if trincas else 0
+        # Última visão em conjunto do bitset, como (bitset, conjunto)
+        self._trincas_view: Optional[Tuple[int, FrozenSet[int]]] = None
+        # Trincas de todos os jogos, com repetições; construída sob demanda
+        self._trincas_list: Optional[List[int]] = None
         self.fitness = 0.0
         self.creation_method = creation_method
+        # Cache das trincas de cada jogo (conjunto e bitset), indexado pelo
+        # conteúdo do jogo
+        self._trinca_cache: Dict[Tuple[int, ...], Tuple[FrozenSet[int], int]] = {}
+        # Quantos jogos cobrem cada trinca; construído sob demanda por swap_game
+        self._trinca_counts: Optional[Counter] = None
+        # Indica se _trinca_counts é compartilhado com uma cópia do indivíduo
+        # (copy-on-write: é copiado antes da primeira alteração)
+        self._trinca_counts_shared = False
+    
+    def __getstate__(self) -> dict:
+        """
+        Estado usado na serialização (pickle), por exemplo ao enviar o
+        indivíduo para processos de trabalho. O cache de trincas por jogo
+        não é enviado: ele é reconstruído sob demanda no destino.
+        """
+        state = self.__dict__.copy()
+        state['_trinca_cache'] = {}
+        state['_trincas_view'] = None
+        state['_trincas_list'] = None
+        return state
+    
+    @property
+    def trincas(self) -> FrozenSet[int]:
+        """
+        Identificadores das trincas cobertas pelos jogos.
         
-    def generate_random(self, num_games: Optional[int] = None) -> 'Individual':
+        É uma visão somente leitura de trincas_mask, construída sob demanda e
+        reaproveitada enquanto o bitset não mudar. Para apenas contar as
+        trincas, prefira popcount(trincas_mask).
+        """
+        mask = self.trincas_mask
+        view = self._trincas_view
+        if view is None or view[0] is not mask:
+            view = (mask, frozenset(mask_to_trinca_ids(mask)))
+            self._trincas_view = view
+        return view[1]
+    
+    @trincas.setter
+    def trincas(self, trinca_ids) -> None:
+        self.trincas_mask = trinca_ids_to_mask(trinca_ids)
+    
+    @property
+    def trincas_list(self) -> List[int]:
+        """
+        Trincas de todos os jogos, incluindo duplicatas, para análise.
+        
+        Cada jogo ocupa um bloco contíguo da lista, na ordem de games. A lista
+        só é montada quando pedida e é descartada por calculate_trincas.
+        """
+        if self._trincas_list is None:
+            self._trincas_list = list(itertools.chain.from_iterable(
+                map(self.get_game_trincas, self.games)))
+        return self._trincas_list
+    
+    @trincas_list.setter
+    def trincas_list(self, trincas_list: Optional[List[int]]) -> None:
+        self._trincas_list = trincas_list
+        
+    def generate_random(self, num_games: Optional[int] = None, rng=random) -> 'Individual':
         """
         Gera jogos aleatórios para o indivíduo.
         
         Args:
             num_games: Número de jogos a serem gerados. Se não especificado,
                       será calculado com base no multiplicador de jogos.
+            rng: Gerador aleatório usado no sorteio (padrão: o módulo random).
         
         Returns:
             O próprio indivíduo, para permitir encadeamento de métodos.
@@ -85,63 +202,174 @@ class Individual:
             # Um jogo tem 20 trincas. Para cobrir todas as trincas (34220),
             # precisaríamos de cerca de 1711 jogos. Usamos um multiplicador para
             # permitir certa flexibilidade.
-            num_games = int(len(self.all_trincas) / 20 * self.config.games_multiplier)
-        
-        self.games = []
+            num_games = int(TOTAL_TRINCAS / 20 * self.config.games_multiplier)
         
         # Gera jogos aleatórios
-        for i in range(num_games):
-            game = self._generate_random_game()
-            self.games.append(game)
+        self.games = self._generate_random_games(num_games, rng)
             
-        # Calcula as trincas
-        self.calculate_trincas()
+        # Calcula as trincas e o fitness
+        self.evaluate()
         
         self.creation_method = 'random'
         return self
     
-    def _generate_random_game(self) -> List[int]:
+    @staticmethod
+    def _generate_random_games(count: int, rng=random) -> List[Tuple[int, ...]]:
         """
-        Gera um jogo aleatório com 6 números entre 1 e 60.
+        Gera vários jogos aleatórios com 6 números entre 1 e 60.
         
-        Returns:
-            Lista de 6 números aleatórios sem repetição entre 1 e 60.
-        """
-        # Divide os números em faixas para garantir melhor distribuição
-        low_range = list(range(1, 21))     # 1-20
-        mid_range = list(range(21, 41))    # 21-40
-        high_range = list(range(41, 61))   # 41-60 
-        
-        # Embaralha cada faixa
-        random.shuffle(low_range)
-        random.shuffle(mid_range)
-        random.shuffle(high_range)
-        
-        # Seleciona números de cada faixa
-        low_count = random.randint(1, 3)
-        high_count = random.randint(1, 3)
-        mid_count = 6 - low_count - high_count
-        
-        game = (
-            low_range[:low_count] +
-            mid_range[:mid_count] +
-            high_range[:high_count]
-        )
+        Os números são divididos em faixas (1-20, 21-40 e 41-60) para garantir
+        melhor distribuição. Cada jogo custa quatro sorteios: a divisão entre
+        as faixas e uma combinação pré-calculada de cada faixa. As divisões de
+        todos os jogos são sorteadas numa única chamada a rng.choices.
+        
+        Os jogos são tuplas: já servem de chave no cache de trincas sem cópia
+        e ocupam menos memória que listas. Os jogos de um indivíduo nunca são
+        alterados no lugar, apenas substituídos.
         
-        # Embaralha e retorna
-        random.shuffle(game)
-        return sorted(game)
+        Args:
+            count: Número de jogos a gerar.
+            rng: Gerador aleatório usado no sorteio (padrão: o módulo random).
+            
+        Returns:
+            Lista de jogos, cada um uma tupla com 6 números ordenados e sem repetição.
+        """
+        choice = rng.choice
+        return [
+            choice(_LOW_COMBOS[low]) + choice(_MID_COMBOS[mid]) + choice(_HIGH_COMBOS[high])
+            for low, mid, high in rng.choices(_RANGE_SPLITS, k=count)
+        ]
     
     def calculate_trincas(self) -> None:
         """
         Calcula as trincas (combinações de 3 números) cobertas pelos jogos.
-        """
-        self.trincas = extract_trincas_from_games(self.games)
         
-        # Também armazenamos todas as trincas, incluindo duplicatas, para análise
-        self.trincas_list = []
+        As trincas são armazenadas como um bitset sobre os seus identificadores
+        inteiros (ver genetic.trincas.TRINCA_IDS): a cobertura é o OU dos
+        bitsets dos jogos.
+        """
+        # Reaproveita as trincas já extraídas e descarta as de jogos que saíram
+        old_cache = self._trinca_cache
+        self._trinca_cache = cache = {}
+        mask = 0
         for game in self.games:
-            self.trincas_list.extend(list(extract_trincas_from_game(game)))
+            key = tuple(game)
+            entry = old_cache.get(key)
+            if entry is None:
+                entry = self._build_game_entry(game)
+            cache[key] = entry
+            mask |= entry[1]
+        
+        self.trincas_mask = mask
+        # A lista de trincas com repetições e as contagens são refeitas sob demanda
+        self._trincas_list = None
+        self._trinca_counts = None
+    
+    def evaluate(self) -> float:
+        """
+        Recalcula as trincas e o fitness do indivíduo numa única chamada.
+        
+        Returns:
+            O novo valor de fitness.
+        """
+        self.calculate_trincas()
+        return calculate_fitness(self)
+    
+    def get_trinca_counts(self) -> Counter:
+        """
+        Retorna quantos jogos cobrem cada trinca.
+        
+        A contagem é construída sob demanda, mantida por swap_game e
+        descartada por calculate_trincas. Trincas não cobertas não aparecem
+        como chave.
+        """
+        if self._trinca_counts is None:
+            self._trinca_counts = Counter(itertools.chain.from_iterable(
+                map(self.get_game_trincas, self.games)))
+            self._trinca_counts_shared = False
+        elif self._trinca_counts_shared:
+            # A contagem é compartilhada com outro indivíduo (ver copy) e quem
+            # a recebe pode alterá-la: faz a cópia só agora
+            self._trinca_counts = self._trinca_counts.copy()
+            self._trinca_counts_shared = False
+        return self._trinca_counts
+    
+    def swap_game(self, game_idx: int, new_game: List[int]) -> List[int]:
+        """
+        Substitui um jogo atualizando as trincas de forma incremental.
+        
+        Em vez de recalcular as trincas de todos os jogos, apenas as trincas
+        do jogo removido e do jogo inserido são contabilizadas.
+        
+        Args:
+            game_idx: Índice do jogo a ser substituído.
+            new_game: Novo jogo.
+            
+        Returns:
+            Trincas que deixaram de ser cobertas com a troca.
+        """
+        counts = self.get_trinca_counts()
+        
+        old_trincas = self.get_game_trincas(self.games[game_idx])
+        new_trincas = self.get_game_trincas(new_game)
+        
+        counts.subtract(old_trincas)
+        counts.update(new_trincas)
+        lost_trincas = [trinca for trinca in old_trincas if not counts[trinca]]
+        for trinca in lost_trincas:
+            del counts[trinca]
+        self.trincas_mask = ((self.trincas_mask & ~trinca_ids_to_mask(lost_trincas))
+                             | self.get_game_mask(new_game))
+        
+        # Cada jogo ocupa um bloco contíguo (de 20 trincas) em trincas_list,
+        # atualizada apenas se já tiver sido montada
+        if self._trincas_list is not None:
+            start = game_idx * len(old_trincas)
+            self._trincas_list[start:start + len(old_trincas)] = new_trincas
+        self.games[game_idx] = new_game
+        return lost_trincas
+    
+    def get_game_trincas(self, game: List[int]) -> FrozenSet[int]:
+        """
+        Retorna as trincas de um jogo, usando o cache do indivíduo.
+        
+        Como o cache é indexado pelo conteúdo do jogo, ele continua válido
+        quando jogos são trocados ou substituídos.
+        
+        Args:
+            game: Jogo cujas trincas serão retornadas.
+            
+        Returns:
+            Conjunto imutável com os identificadores das trincas do jogo.
+        """
+        return self._get_game_entry(game)[0]
+    
+    def get_game_mask(self, game: List[int]) -> int:
+        """
+        Retorna as trincas de um jogo como bitset, usando o cache do indivíduo.
+        
+        Args:
+            game: Jogo cujas trincas serão retornadas.
+            
+        Returns:
+            Inteiro com o bit de cada trinca do jogo ligado.
+        """
+        return self._get_game_entry(game)[1]
+    
+    def _get_game_entry(self, game: List[int]) -> Tuple[FrozenSet[int], int]:
+        """Retorna (trincas, bitset) de um jogo, extraindo-os na primeira vez."""
+        key = tuple(game)
+        entry = self._trinca_cache.get(key)
+        if entry is None:
+            entry = self._build_game_entry(game)
+            self._trinca_cache[key] = entry
+        return entry
+    
+    @staticmethod
+    def _build_game_entry(game: List[int]) -> Tuple[FrozenSet[int], int]:
+        """Extrai as trincas de um jogo como conjunto e como bitset."""
+        game_trincas = frozenset(extract_trinca_ids_from_game(game))
+        return game_trincas, trinca_ids_to_mask(game_trincas)
     
     def get_trincas_coverage(self) -> float:
         """
@@ -150,9 +378,9 @@ class Individual:
         Returns:
             Porcentagem de trincas cobertas (0.0 a 1.0).
         """
-        if not self.trincas:
+        if not self.trincas_mask:
             self.calculate_trincas()
-        return len(self.trincas) / len(self.all_trincas)
+        return popcount(self.trincas_mask) / TOTAL_TRINCAS
     
     def get_trincas_redundancy(self) -> float:
         """
@@ -161,9 +389,20 @@ class Individual:
         Returns:
             Taxa de redundância (média de aparições por trinca).
         """
-        if not self.trincas:
+        if not self.trincas_mask:
             return 0.0
-        return len(self.trincas_list) / len(self.trincas)
+        total_trincas = sum(len(self.get_game_trincas(game)) for game in self.games)
+        return total_trincas / popcount(self.trincas_mask)
+    
+    def merge_trinca_cache(self, other: 'Individual') -> None:
+        """
+        Incorpora ao cache deste indivíduo as trincas já extraídas dos jogos de
+        outro indivíduo.
+        
+        Útil quando jogos de outro indivíduo serão inseridos neste (como no
+        crossover): eles não precisam ter suas trincas extraídas novamente.
+        """
+        self._trinca_cache.update(other._trinca_cache)
     
     def copy(self) -> 'Individual':
         """
@@ -175,7 +414,17 @@ class Individual:
         new_individual = Individual(self.config)
         # Como os jogos são tuplas, não precisamos fazer deep copy
         new_individual.games = self.games.copy()
-        new_individual.calculate_trincas()
+        # As trincas já calculadas são copiadas em vez de recalculadas: o
+        # bitset é imutável e pode ser compartilhado
+        new_individual.trincas_mask = self.trincas_mask
+        new_individual._trinca_cache = self._trinca_cache.copy()
+        # As contagens por trinca, se já construídas, são compartilhadas e só
+        # copiadas quando um dos dois indivíduos precisar delas (muitas cópias,
+        # como os filhos do crossover, recalculam as trincas antes disso)
+        if self._trinca_counts is not None:
+            new_individual._trinca_counts = self._trinca_counts
+            new_individual._trinca_counts_shared = True
+            self._trinca_counts_shared = True
         new_individual.fitness = self.fitness
         new_individual.creation_method = self.creation_method
         return new_individual
@@ -189,7 +438,7 @@ class Individual:
         
         return (
             f"Indivíduo com {len(self.games)} jogos:\n"
-            f"  Trincas cobertas: {len(self.trincas)} de {len(self.all_trincas)} ({coverage:.2f}%)\n"
+            f"  Trincas cobertas: {popcount(self.trincas_mask)} de {TOTAL_TRINCAS} ({coverage:.2f}%)\n"
             f"  Redundância: {redundancy:.2f}\n"
             f"  Fitness: {self.fitness:.2f}"
         )
@@ -224,44 +473,48 @@ class Individual:
     @staticmethod
     def _optimize_individual(individual: 'Individual') -> 'Individual':
         """Otimiza um indivíduo removendo jogos redundantes e melhorando a cobertura"""
-        # Calcula o fitness inicial
+        # Calcula o fitness inicial e guarda o estado original para a reversão
         fitness_inicial = calculate_fitness(individual)
+        jogos_originais = individual.games
+        mascara_original = individual.trincas_mask
+        trincas_list_original = individual._trincas_list
+        contagens_originais = individual._trinca_counts
         
-        # Remove jogos redundantes
-        jogos_otimizados = []
-        trincas_cobertas = set()
-        
-        # Ordena os jogos pelo número de trincas novas que adicionam
-        jogos_ordenados = []
-        for jogo in individual.games:
-            trincas_jogo = set(extract_trincas_from_game(jogo))
-            trincas_novas = trincas_jogo - trincas_cobertas
-            jogos_ordenados.append((jogo, len(trincas_novas)))
+        # Trincas (ids e bitset) de cada jogo, extraídas uma única vez
+        entradas = [(jogo, individual._get_game_entry(jogo)) for jogo in individual.games]
         
-        # Ordena os jogos pelo número de trincas novas (decrescente)
-        jogos_ordenados.sort(key=lambda x: x[1], reverse=True)
+        # Ordena os jogos pelo número de trincas que adicionam (decrescente)
+        entradas.sort(key=lambda item: len(item[1][0]), reverse=True)
         
-        # Mantém apenas os jogos que adicionam trincas novas
-        for jogo, num_trincas_novas in jogos_ordenados:
-            if num_trincas_novas > 0:
+        # Mantém apenas os jogos que adicionam trincas novas, atualizando a
+        # cobertura de forma incremental
+        jogos_otimizados = []
+        trincas_cobertas = 0
+        for jogo, (_, mascara_jogo) in entradas:
+            if mascara_jogo & ~trincas_cobertas:
                 jogos_otimizados.append(jogo)
-                trincas_cobertas.update(extract_trincas_from_game(jogo))
+                trincas_cobertas |= mascara_jogo
         
-        # Atualiza os jogos do indivíduo
+        # Atualiza os jogos do indivíduo sem recalcular as trincas do zero
         individual.games = jogos_otimizados
-        individual.calculate_trincas()
+        individual.trincas_mask = trincas_cobertas
+        individual._trincas_list = None
+        individual._trinca_counts = None
         fitness_final = calculate_fitness(individual)
         
         # Se a otimização piorou o fitness, reverte as mudanças
         if fitness_final < fitness_inicial:
-            individual.games = individual.games
-            individual.calculate_trincas()
-            calculate_fitness(individual)
+            individual.games = jogos_originais
+            individual.trincas_mask = mascara_original
+            individual._trincas_list = trincas_list_original
+            individual._trinca_counts = contagens_originais
+            individual.fitness = fitness_inicial
         
         return individual 
 
     @staticmethod
-    def generate_by_smart_coverage(config: Config, num_games: Optional[int] = None, random_percentage: float = 0.25) -> 'Individual':
+    def generate_by_smart_coverage(config: Config, num_games: Optional[int] = None, random_percentage: float = 0.25,
+                                   rng=random) -> 'Individual':
         """Gera um indivíduo usando uma heurística inteligente de cobertura.
         
         Estratégia:
@@ -275,6 +528,7 @@ class Individual:
             config: Configurações do algoritmo genético
             num_games: Número de jogos a gerar. Se não especificado, será calculado com base no multiplicador de jogos
             random_percentage: Porcentagem de jogos aleatórios (0.0 a 1.0)
+            rng: Gerador aleatório usado nos sorteios (padrão: o módulo random)
         """
         # Se não especificado, calcula o número de jogos baseado no multiplicador
         if num_games is None:
@@ -285,48 +539,55 @@ class Individual:
         
         # 1. Cria uma porcentagem dos jogos de forma aleatória
         jogos_iniciais = int(num_games * random_percentage)
-        for _ in range(jogos_iniciais):
-            individual.games.append(individual._generate_random_game())
+        individual.games.extend(Individual._generate_random_games(jogos_iniciais, rng))
         
         # Calcula trincas iniciais
         individual.calculate_trincas()
         
-        # 2. Identifica trincas faltantes usando um set para performance
-        trincas_faltantes = set(TRINCAS) - individual.trincas
+        # 2. Identifica trincas faltantes: o bitset diz quais ainda faltam e a
+        # lista de candidatas permite sortear uma delas sem percorrer o bitset
+        faltantes_mask = ALL_TRINCAS_MASK & ~individual.trincas_mask
+        candidatas = mask_to_trinca_ids(faltantes_mask)
         
         # 3. Cria jogos focados nas trincas faltantes
         max_tentativas = num_games - jogos_iniciais
         tentativas = 0
         
-        while trincas_faltantes and tentativas < max_tentativas:
-            # Seleciona uma trinca aleatória das faltantes
-            trinca_alvo = random.choice(list(trincas_faltantes))
+        while faltantes_mask and tentativas < max_tentativas:
+            # Seleciona uma trinca aleatória das faltantes; candidatas já
+            # cobertas são descartadas (troca com a última e remove) ao serem sorteadas
+            idx = rng.randrange(len(candidatas))
+            trinca_alvo = candidatas[idx]
+            if not (faltantes_mask >> trinca_alvo) & 1:
+                candidatas[idx] = candidatas[-1]
+                candidatas.pop()
+                continue
             
             # Cria um jogo que contém a trinca alvo
-            jogo = list(trinca_alvo)
+            jogo = list(TRINCAS_BY_ID[trinca_alvo])
             
-            # Adiciona 3 números complementares
-            numeros_disponiveis = [n for n in range(1, 61) if n not in jogo]
-            complementares = random.sample(numeros_disponiveis, 3)
-            jogo.extend(complementares)
+            # Adiciona 3 números complementares: dos 6 sorteados, no máximo 3
+            # pertencem à trinca, então sempre sobram 3 (uniformes entre os 57)
+            complementares = [n for n in rng.sample(_ALL_NUMBERS, 6) if n not in jogo]
+            jogo.extend(complementares[:3])
             
             # Ordena e adiciona o jogo
-            individual.games.append(sorted(jogo))
+            jogo.sort()
+            jogo = tuple(jogo)
+            individual.games.append(jogo)
             
-            # Atualiza trincas e faltantes
-            novas_trincas = set(extract_trincas_from_game(jogo))
-            trincas_faltantes -= novas_trincas
-            individual.trincas.update(novas_trincas)
+            # Atualiza trincas e faltantes com o bitset do jogo
+            mascara_jogo = individual.get_game_mask(jogo)
+            faltantes_mask &= ~mascara_jogo
+            individual.trincas_mask |= mascara_jogo
             
             tentativas += 1
         
         # 4. Completa com jogos aleatórios se necessário
         jogos_restantes = num_games - len(individual.games)
-        for _ in range(jogos_restantes):
-            individual.games.append(individual._generate_random_game())
+        individual.games.extend(Individual._generate_random_games(jogos_restantes, rng))
         
         # Calcula fitness final
-        individual.calculate_trincas()
-        individual.fitness = calculate_fitness(individual)
+        individual.evaluate()
         
         return individual
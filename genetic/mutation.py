@@ -2,15 +2,65 @@
 Funções de mutação para o algoritmo genético.
 """
 
+import math
 import random
-import time
-from typing import Set, Tuple, Dict, List
+from typing import Set, Tuple, Dict, List, Iterator
 
 from genetic.individual import Individual
-from genetic.trincas import extract_trincas_from_game, TRINCAS
+from genetic.trincas import (
+    mask_to_trinca_ids,
+    ALL_TRINCAS_MASK,
+    TRINCAS_BY_ID,
+)
 from genetic.config import Config
 
 
+def _discard_missing(missing: List[int], positions: Dict[int, int], trinca: int) -> None:
+    """
+    Remove uma trinca da lista de faltantes em O(1), trocando-a com a última.
+    
+    Args:
+        missing: Lista de trincas faltantes.
+        positions: Posição de cada trinca em missing.
+        trinca: Trinca a remover (ignorada se não estiver na lista).
+    """
+    idx = positions.pop(trinca, None)
+    if idx is None:
+        return
+    last = missing.pop()
+    if last != trinca:
+        missing[idx] = last
+        positions[last] = idx
+
+
+def _sampled_indices(n: int, rate: float, rng=random) -> Iterator[int]:
+    """
+    Gera, em ordem crescente, os índices de 0 a n-1 sorteados com probabilidade rate.
+    
+    Equivale a testar rng.random() < rate para cada índice, mas salta
+    diretamente para o próximo índice sorteado (a distância entre sorteios
+    segue uma distribuição geométrica), consumindo cerca de n * rate números
+    aleatórios em vez de n.
+    
+    Args:
+        n: Número de índices.
+        rate: Probabilidade de cada índice ser sorteado.
+        rng: Gerador aleatório usado no sorteio (padrão: o módulo random).
+    """
+    if rate <= 0:
+        return
+    if rate >= 1:
+        yield from range(n)
+        return
+    log_q = math.log(1.0 - rate)
+    i = -1
+    while True:
+        i += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if i >= n:
+            return
+        yield i
+
+
 class Mutation:
     """Classe que implementa operadores de mutação para o algoritmo genético."""
     
@@ -24,157 +74,104 @@ class Mutation:
         """
         self.config = config or Config()  # Usa a configuração passada ou cria uma nova
         self.mutation_rate = mutation_rate or self.config.mutation_rate
-        self._trincas_to_games: Dict[Tuple[int, int, int], List[List[int]]] = {}
-        self._build_trincas_to_games_mapping()
-    
-    def _build_trincas_to_games_mapping(self) -> None:
-        """Constrói o mapeamento de trincas para jogos que as contêm."""
-        print("Iniciando construção do mapeamento de trincas para jogos...")
-        start_time = time.time()
-        
-        # Limpa o mapeamento existente
-        self._trincas_to_games.clear()
-        
-        # Pré-aloca espaço para todas as trincas
-        for trinca in TRINCAS:
-            self._trincas_to_games[trinca] = []
-        
-        # Gera jogos sob demanda para cada trinca
-        jogos_por_trinca = 10  # Número de jogos diferentes por trinca
-        total_trincas = len(TRINCAS)
-        
-        for i, trinca in enumerate(TRINCAS):
-            #if (i + 1) % 1000 == 0:  # Log a cada 1000 trincas
-            #    print(f"Processando trinca {i+1}/{total_trincas}")
-            
-            # Gera jogos diferentes que contêm esta trinca
-            for _ in range(jogos_por_trinca):
-                game = list(trinca)
-                # Completa o jogo com números aleatórios
-                while len(game) < 6:
-                    num = random.randint(1, 60)
-                    if num not in game:
-                        game.append(num)
-                game.sort()
-                self._trincas_to_games[trinca].append(game)
-        
-        end_time = time.time()
-        print(f"Mapeamento construído em {end_time - start_time:.2f} segundos")
-        print(f"Total de trincas mapeadas: {len(self._trincas_to_games)}")
-        print(f"Jogos por trinca: {jogos_por_trinca}")
-        print(f"Total de jogos gerados: {len(self._trincas_to_games) * jogos_por_trinca}")
-        
-        # Calcula estatísticas do mapeamento
-        games_per_trinca = [len(games) for games in self._trincas_to_games.values()]
-        avg_games = sum(games_per_trinca) / len(games_per_trinca)
-        min_games = min(games_per_trinca)
-        max_games = max(games_per_trinca)
-        
-        print(f"\nEstatísticas de jogos por trinca:")
-        print(f"  Média: {avg_games:.1f}")
-        print(f"  Mínimo: {min_games}")
-        print(f"  Máximo: {max_games}")
+        # Gerador aleatório próprio quando há semente na configuração; caso
+        # contrário, usa o gerador global do módulo random
+        self.rng = random if self.config.seed is None else random.Random(self.config.seed)
     
     def mutate_by_redundancy(self, individual: Individual) -> None:
         """Remove jogos que não têm contribuição única."""
-        if not self._trincas_to_games:
-            self._build_trincas_to_games_mapping()
+        # Quantos jogos do indivíduo cobrem cada trinca (contagem mantida
+        # pelo próprio indivíduo, sem montar listas de jogos por trinca)
+        trinca_counts = individual.get_trinca_counts()
 
-        # Mapeia trincas para jogos no indivíduo atual
-        trincas_to_games: Dict[Tuple[int, int, int], List[List[int]]] = {}
+        # Remove, um a um, jogos cujas trincas são todas cobertas por outro
+        # jogo restante. A contagem é atualizada a cada remoção, então dois
+        # jogos que só se cobrem mutuamente não são removidos juntos e a
+        # cobertura do indivíduo nunca diminui.
+        kept_games = []
         for game in individual.games:
-            trincas = extract_trincas_from_game(game)
-            for trinca in trincas:
-                if trinca not in trincas_to_games:
-                    trincas_to_games[trinca] = []
-                trincas_to_games[trinca].append(game)
+            game_trincas = individual.get_game_trincas(game)
+            if all(trinca_counts[trinca] > 1 for trinca in game_trincas):
+                trinca_counts.subtract(game_trincas)
+            else:
+                kept_games.append(game)
 
-        # Identifica jogos que podem ser removidos
-        games_to_remove = set()
-        for game in individual.games:
-            game_trincas = extract_trincas_from_game(game)
-            can_remove = True
-            for trinca in game_trincas:
-                if len(trincas_to_games[trinca]) <= 1:
-                    can_remove = False
-                    break
-            if can_remove:
-                games_to_remove.add(tuple(game))
-
-        # Remove jogos redundantes
-        individual.games = [game for game in individual.games if tuple(game) not in games_to_remove]
-        individual.calculate_trincas()
+        # A cobertura não muda e as contagens já foram atualizadas a cada
+        # remoção, então não é preciso recalcular as trincas
+        if len(kept_games) != len(individual.games):
+            individual.games = kept_games
+            individual.trincas_list = None
     
     def mutate_by_smart_replacement(self, individual: Individual) -> None:
         """Realiza mutação inteligente substituindo jogos por novos que contêm trincas faltantes."""
-        # Identifica trincas faltantes
-        missing_trincas = TRINCAS - individual.trincas
+        # Identifica trincas faltantes (lista de ids decodificada do bitset)
+        missing_trincas = mask_to_trinca_ids(ALL_TRINCAS_MASK & ~individual.trincas_mask)
         
         if not missing_trincas:
             # Se não há trincas faltantes, faz uma mutação aleatória simples
-            for i in range(len(individual.games)):
-                if random.random() < self.mutation_rate:
-                    individual.games[i] = random.choice(self.config.all_possible_games)
+            for i in _sampled_indices(len(individual.games), self.mutation_rate, self.rng):
+                individual.games[i] = self.rng.choice(self.config.all_possible_games)
             individual.calculate_trincas()
             return
 
+        # Posição de cada trinca faltante na lista, para removê-la em O(1)
+        missing_positions = {trinca: idx for idx, trinca in enumerate(missing_trincas)}
+
         # Para cada jogo, com probabilidade mutation_rate
-        for i in range(len(individual.games)):
-            if random.random() < self.mutation_rate:
-                # Se só tiver uma trinca faltante, usa ela e completa com aleatórios
-                if len(missing_trincas) == 1:
-                    target_trinca = list(missing_trincas)[0]
-                    new_game = list(target_trinca)
-                    
-                    # Completa o jogo com números aleatórios
-                    while len(new_game) < 6:
-                        num = random.randint(1, 60)
-                        if num not in new_game:
-                            new_game.append(num)
-                    
-                    # Ordena os números
-                    new_game.sort()
-                    
-                    # Substitui o jogo
-                    individual.games[i] = new_game
-                    
-                    # Atualiza as trincas
-                    individual.calculate_trincas()
-                    return
-                    
-                # Seleciona duas trincas faltantes aleatórias
-                target_trincas = random.sample(list(missing_trincas), 2)
-                
-                # Cria um novo jogo que contém as duas trincas faltantes
-                new_game = []
-                used_numbers = set()
-                
-                # Adiciona os números das duas trincas
-                for trinca in target_trincas:
-                    for num in trinca:
-                        if num not in used_numbers:
-                            new_game.append(num)
-                            used_numbers.add(num)
+        for i in _sampled_indices(len(individual.games), self.mutation_rate, self.rng):
+            # Se só tiver uma trinca faltante, usa ela e completa com aleatórios
+            if len(missing_trincas) == 1:
+                target_trinca = missing_trincas[0]
+                new_game = list(TRINCAS_BY_ID[target_trinca])
                 
                 # Completa o jogo com números aleatórios
                 while len(new_game) < 6:
-                    num = random.randint(1, 60)
-                    if num not in used_numbers:
+                    num = self.rng.randint(1, 60)
+                    if num not in new_game:
                         new_game.append(num)
-                        used_numbers.add(num)
-                
-                # Ordena os números
-                new_game.sort()
                 
-                # Substitui o jogo
-                individual.games[i] = new_game
+                # Ordena os números; os jogos do indivíduo são tuplas
+                new_game = tuple(sorted(new_game))
                 
-                # Atualiza as trincas
-                individual.calculate_trincas()
+                # Substitui o jogo, atualizando as trincas de forma incremental
+                individual.swap_game(i, new_game)
+                return
                 
-                # Atualiza trincas faltantes
-                missing_trincas = TRINCAS - individual.trincas
-                
-                # Se não há mais trincas faltantes, para
-                if not missing_trincas:
-                    break 
+            # Seleciona duas trincas faltantes aleatórias
+            target_trincas = self.rng.sample(missing_trincas, 2)
+            
+            # Cria um novo jogo que contém as duas trincas faltantes
+            new_game = []
+            used_numbers = set()
+            
+            # Adiciona os números das duas trincas
+            for trinca in target_trincas:
+                for num in TRINCAS_BY_ID[trinca]:
+                    if num not in used_numbers:
+                        new_game.append(num)
+                        used_numbers.add(num)
+            
+            # Completa o jogo com números aleatórios
+            while len(new_game) < 6:
+                num = self.rng.randint(1, 60)
+                if num not in used_numbers:
+                    new_game.append(num)
+                    used_numbers.add(num)
+            
+            # Ordena os números; os jogos do indivíduo são tuplas
+            new_game = tuple(sorted(new_game))
+            
+            # Substitui o jogo, atualizando as trincas de forma incremental
+            lost_trincas = individual.swap_game(i, new_game)
+            
+            # Atualiza trincas faltantes: as do novo jogo saem da lista e
+            # as que só o jogo antigo cobria entram
+            for trinca in individual.get_game_trincas(new_game):
+                _discard_missing(missing_trincas, missing_positions, trinca)
+            for trinca in lost_trincas:
+                missing_positions[trinca] = len(missing_trincas)
+                missing_trincas.append(trinca)
+            
+            # Se não há mais trincas faltantes, para
+            if not missing_trincas:
+                break 
@@ -2,15 +2,81 @@
 Gerenciamento de população de indivíduos para o algoritmo genético.
 """
 
+import heapq
+import os
 import random
 import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Optional
 
 from genetic.config import Config
-from genetic.individual import Individual, calculate_fitness
-from genetic.selection import tournament_selection
+from genetic.individual import Individual, calculate_fitness_batch
+from genetic.selection import tournament_selection_pair
 from genetic.crossover import Crossover
 from genetic.mutation import Mutation
+from genetic.trincas import popcount
+from genetic.workers import WorkerPool, with_rng, worker_operator
+
+# Abaixo deste número de indivíduos o custo de criar processos e serializar
+# os indivíduos supera o ganho do paralelismo na inicialização
+MIN_PARALLEL_INDIVIDUALS = 8
+
+# O mesmo limite, em pares de pais, para a geração de filhos em evolve
+MIN_PARALLEL_FAMILIES = 8
+
+def _create_individual(task: Tuple[Config, Optional[float], int]) -> Individual:
+    """
+    Cria um indivíduo da população inicial num processo de trabalho.
+    
+    Args:
+        task: Tupla (config, random_percentage, seed). random_percentage None
+            indica um indivíduo totalmente aleatório.
+    """
+    config, random_percentage, seed = task
+    # Cada tarefa tem sua própria semente, sorteada no processo principal, para
+    # que o resultado não dependa de qual processo executa qual indivíduo
+    rng = random.Random(seed)
+    if random_percentage is None:
+        return Individual(config=config).generate_random(rng=rng)
+    return Individual.generate_by_smart_coverage(config, random_percentage=random_percentage, rng=rng)
+
+
+def _breed(crossover: Crossover, mutation: Mutation,
+           parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
+    """
+    Gera dois filhos a partir de dois pais.
+    
+    Aplica o crossover por redundância, a mutação inteligente e a remoção de
+    jogos redundantes. O fitness dos filhos não é calculado.
+    """
+    # Realiza crossover
+    child1, child2 = crossover.crossover_by_redundancy(parent1, parent2)
+    
+    # Aplica mutação inteligente
+    mutation.mutate_by_smart_replacement(child1)
+    mutation.mutate_by_smart_replacement(child2)
+    
+    # Remove jogos redundantes
+    mutation.mutate_by_redundancy(child1)
+    mutation.mutate_by_redundancy(child2)
+    
+    return child1, child2
+
+
+def _breed_seeded(crossover: Crossover, mutation: Mutation,
+                  task: Tuple[int, Individual, Individual]) -> Tuple[Individual, Individual]:
+    """Gera os filhos de um par de pais a partir da semente da tarefa."""
+    seed, parent1, parent2 = task
+    # Cada tarefa tem sua própria semente, sorteada no processo principal, para
+    # que o resultado não dependa de qual processo executa qual par. Os
+    # operadores recebidos não são alterados: a tarefa usa cópias com o seu gerador
+    rng = random.Random(seed)
+    return _breed(with_rng(crossover, rng), with_rng(mutation, rng), parent1, parent2)
+
+
+def _breed_family(task: Tuple[int, Individual, Individual]) -> Tuple[Individual, Individual]:
+    """Gera os filhos de um par de pais num processo de trabalho."""
+    return _breed_seeded(worker_operator(Crossover), worker_operator(Mutation), task)
 
 
 class Population:
@@ -29,12 +95,29 @@ class Population:
         self.individuals: List[Individual] = []
         self.best_individual: Optional[Individual] = None
         self.generation = 0
-        self.crossover = Crossover(config)
-        self.mutation = Mutation(config)
+        # Gerador da população: sorteia os pais e as sementes de cada tarefa de
+        # criação e de reprodução, que são então executadas da mesma forma
+        # no processo atual ou nos processos de trabalho
+        self.rng = random if config.seed is None else random.Random(config.seed)
+        # Os operadores usam o mesmo gerador da população, em vez de cada um
+        # criar o seu a partir da mesma semente (o que repetiria a sequência
+        # de sorteios em todos eles)
+        self.crossover = with_rng(Crossover(config), self.rng)
+        self.mutation = with_rng(Mutation(config), self.rng)
+        # Pool de processos usado para gerar os filhos, criado na primeira
+        # geração paralela e reaproveitado nas seguintes
+        self._pool = WorkerPool(config, (Crossover, Mutation))
     
-    def _initialize_population(self):
-        """Inicializa a população com indivíduos usando diferentes estratégias de criação"""
-        print("\nInicializando população...")
+    def _initialize_population(self, max_workers: Optional[int] = None):
+        """
+        Inicializa a população com indivíduos usando diferentes estratégias de criação.
+        
+        Args:
+            max_workers: Número de processos usados para criar os indivíduos
+                (padrão: os.cpu_count()).
+        """
+        if self.config.verbose:
+            print("\nInicializando população...")
         start_time = time.time()
         
         # Calcula quantos indivíduos serão gerados por cada método
@@ -42,49 +125,115 @@ class Population:
         dez_porcento = total // 10
         quarenta_porcento = total // 2 - dez_porcento
         
-        # 10% com 10% aleatórios
-        for _ in range(dez_porcento):
-            ind = Individual.generate_by_smart_coverage(self.config, random_percentage=0.10)
-            self.individuals.append(ind)
-        
-        # 40% com 25% aleatórios
-        for _ in range(quarenta_porcento):
-            ind = Individual.generate_by_smart_coverage(self.config, random_percentage=0.25)
-            self.individuals.append(ind)
-        
-        # 40% com 50% aleatórios
-        for _ in range(quarenta_porcento):
-            ind = Individual.generate_by_smart_coverage(self.config, random_percentage=0.50)
-            self.individuals.append(ind)
-        
-        # 10% totalmente aleatórios
-        for _ in range(dez_porcento):
-            ind = Individual(config=self.config)
-            ind.generate_random()
-            self.individuals.append(ind)
+        # Proporção de jogos aleatórios de cada indivíduo (None: totalmente aleatório)
+        # 10% com 10% aleatórios, 40% com 25%, 40% com 50% e 10% totalmente aleatórios
+        percentages = ([0.10] * dez_porcento + [0.25] * quarenta_porcento
+                       + [0.50] * quarenta_porcento + [None] * dez_porcento)
+        self.individuals.extend(self._create_individuals(percentages, max_workers))
         
         # Atualiza o melhor indivíduo
         self.best_individual = max(self.individuals, key=lambda x: x.fitness)
         
         # Calcula e exibe estatísticas
-        end_time = time.time()
-        print(f"Tempo de inicialização: {end_time - start_time:.2f} segundos")
-        print(f"Melhor fitness inicial: {self.best_individual.fitness:.2f}")
-        print(f"Melhor indivíduo:")
-        print(f"  Método: {self.best_individual.creation_method}")
-        print(f"  Trincas cobertas: {len(self.best_individual.trincas):,} ({self.best_individual.get_trincas_coverage()*100:.2f}%)")
-        print(f"  Número de jogos: {len(self.best_individual.games):,} ({self.config.games_multiplier*100:.2f}% do mínimo teórico)\n")
+        if self.config.verbose:
+            end_time = time.time()
+            print(f"Tempo de inicialização: {end_time - start_time:.2f} segundos")
+            print(f"Melhor fitness inicial: {self.best_individual.fitness:.2f}")
+            print(f"Melhor indivíduo:")
+            print(f"  Método: {self.best_individual.creation_method}")
+            print(f"  Trincas cobertas: {popcount(self.best_individual.trincas_mask):,} ({self.best_individual.get_trincas_coverage()*100:.2f}%)")
+            print(f"  Número de jogos: {len(self.best_individual.games):,} ({self.config.games_multiplier*100:.2f}% do mínimo teórico)\n")
         
         self.generation = 1
     
+    def _create_individuals(self, percentages: List[Optional[float]],
+                            max_workers: Optional[int] = None) -> List[Individual]:
+        """
+        Cria os indivíduos da população inicial, em paralelo quando vale a pena.
+        
+        Os indivíduos são independentes entre si, então são distribuídos entre
+        processos de trabalho (mestre-escravo). Populações pequenas (menos de
+        MIN_PARALLEL_INDIVIDUALS indivíduos) ou com um único processo são
+        criadas sequencialmente no processo atual.
+        
+        Em plataformas que iniciam processos com 'spawn' (Windows, macOS), o
+        script que chama este método deve estar protegido por
+        ``if __name__ == '__main__':``.
+        
+        Args:
+            percentages: Proporção de jogos aleatórios de cada indivíduo;
+                None indica um indivíduo totalmente aleatório.
+            max_workers: Número de processos (padrão: os.cpu_count()).
+            
+        Returns:
+            Lista de indivíduos, na mesma ordem de percentages.
+        """
+        n_workers = max_workers or os.cpu_count() or 1
+        tasks = [(self.config, percentage, self.rng.getrandbits(64)) for percentage in percentages]
+        
+        if len(tasks) < MIN_PARALLEL_INDIVIDUALS or n_workers < 2:
+            return [_create_individual(task) for task in tasks]
+        
+        chunksize = max(1, len(tasks) // (4 * n_workers))
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(_create_individual, tasks, chunksize=chunksize))
+    
+    def _breed_families(self, parent_pairs: List[Tuple[Individual, Individual]],
+                        max_workers: Optional[int] = None) -> List[Tuple[Individual, Individual]]:
+        """
+        Gera os filhos de vários pares de pais, em paralelo quando vale a pena.
+        
+        Cada par é independente dos demais, então os pares são distribuídos
+        entre processos de trabalho. Gerações pequenas (menos de
+        MIN_PARALLEL_FAMILIES pares) ou com um único processo são executadas
+        sequencialmente no processo atual.
+        
+        Em plataformas que iniciam processos com 'spawn' (Windows, macOS), o
+        script que chama este método deve estar protegido por
+        ``if __name__ == '__main__':``.
+        
+        Args:
+            parent_pairs: Lista de pares (parent1, parent2).
+            max_workers: Número de processos (padrão: os.cpu_count()).
+            
+        Returns:
+            Lista de pares (child1, child2), na mesma ordem dos pares de pais.
+        """
+        n_workers = max_workers or os.cpu_count() or 1
+        tasks = [(self.rng.getrandbits(64), parent1, parent2) for parent1, parent2 in parent_pairs]
+        
+        if len(tasks) < MIN_PARALLEL_FAMILIES or n_workers < 2:
+            return [_breed_seeded(self.crossover, self.mutation, task) for task in tasks]
+        
+        chunksize = max(1, len(tasks) // (4 * n_workers))
+        executor = self._pool.get(n_workers)
+        return list(executor.map(_breed_family, tasks, chunksize=chunksize))
+    
+    def close(self) -> None:
+        """
+        Encerra o pool de processos de geração dos filhos, se existir.
+        
+        A população também pode ser usada num bloco with, que chama close()
+        ao sair.
+        """
+        self._pool.close()
+    
+    def __enter__(self) -> 'Population':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def _update_best(self) -> None:
         """
         Atualiza o melhor indivíduo da população.
         """
         current_best = max(self.individuals, key=lambda ind: ind.fitness)
         
+        # Os indivíduos da população nunca são alterados no lugar (crossover e
+        # mutação trabalham sobre cópias), então basta guardar a referência
         if self.best_individual is None or current_best.fitness > self.best_individual.fitness:
-            self.best_individual = current_best.copy()
+            self.best_individual = current_best
     
     def update_best_individual(self) -> None:
         """
@@ -107,21 +256,22 @@ class Population:
         Returns:
             Tupla com dois indivíduos selecionados.
         """
-        parent1 = tournament_selection(self)
-        parent2 = tournament_selection(self)
+        # Os dois torneios usam participantes disjuntos, então os pais são
+        # sempre diferentes
+        parent1, parent2 = tournament_selection_pair(self, rng=self.rng)
         
-        # Garante que os pais são diferentes
-        while parent2 is parent1:
-            parent2 = tournament_selection(self)
-            
         return parent1, parent2
     
-    def evolve(self) -> None:
+    def evolve(self, max_workers: Optional[int] = None) -> None:
         """
         Evolui a população para a próxima geração.
+        
+        Args:
+            max_workers: Número de processos usados para gerar os filhos
+                (padrão: os.cpu_count()).
         """
-        start_time = time.time()
-        print(f"\nIniciando geração {self.generation}...")
+        if self.config.verbose:
+            print(f"\nIniciando geração {self.generation}...")
         
         # Seleciona os melhores indivíduos (elite)
         elite = self.select_elite(self.config.elite_size)
@@ -130,43 +280,26 @@ class Population:
         new_population = []
         new_population.extend(elite)
         
+        # Seleciona os pais de todos os filhos da geração
+        parent_pairs = []
+        num_children = len(new_population)
+        while num_children < self.config.population_size:
+            parent_pairs.append(self.select_parents())
+            num_children += 2
+        
         # Gera filhos através de crossover e mutação
-        while len(new_population) < self.config.population_size:
-            # Seleciona pais
-            parent1 = self.select_parents()[0]
-            parent2 = self.select_parents()[1]
-            
-            # Calcula fitness dos pais
-            parent1_fitness = calculate_fitness(parent1)
-            parent2_fitness = calculate_fitness(parent2)
-            
-            # Realiza crossover
-            child1, child2 = self.crossover.crossover_by_redundancy(parent1, parent2)
-            
-            # Aplica mutação inteligente
-            self.mutation.mutate_by_smart_replacement(child1)
-            self.mutation.mutate_by_smart_replacement(child2)
-            
-                        
-            # Remove jogos redundantes
-            self.mutation.mutate_by_redundancy(child1)
-            self.mutation.mutate_by_redundancy(child2)
-
-            
-            # Calcula fitness dos filhos
-            child1_fitness = calculate_fitness(child1)
-            child2_fitness = calculate_fitness(child2)
-            
-            # Verifica se os filhos são melhores que os pais
-            if child1_fitness > parent1_fitness:
-                new_population.append(child1)
-            else:
-                new_population.append(parent1)
-                
-            if child2_fitness > parent2_fitness:
-                new_population.append(child2)
-            else:
-                new_population.append(parent2)
+        children = self._breed_families(parent_pairs, max_workers)
+        families = [parents + family_children for parents, family_children in zip(parent_pairs, children)]
+        
+        # Calcula o fitness de todos os filhos de uma só vez
+        calculate_fitness_batch([child for family in families for child in family[2:]])
+        
+        # Mantém cada filho apenas se ele for melhor que o respectivo pai. O
+        # fitness dos pais já foi calculado quando eles foram criados e nunca
+        # fica desatualizado, pois os indivíduos da população não são alterados
+        for parent1, parent2, child1, child2 in families:
+            new_population.append(child1 if child1.fitness > parent1.fitness else parent1)
+            new_population.append(child2 if child2.fitness > parent2.fitness else parent2)
         
         # Ajusta o tamanho da população se necessário
         if len(new_population) > self.config.population_size:
@@ -176,12 +309,12 @@ class Population:
         self.individuals = new_population
         self._update_best()
         
-        end_time = time.time()
-        print(f"Geração {self.generation}:")
-        print(f"  Melhor fitness: {self.best_individual.fitness:.2f}")
-        print(f"  Método: {self.best_individual.creation_method}")
-        print(f"  Trincas cobertas: {len(self.best_individual.trincas):,} ({self.best_individual.get_trincas_coverage()*100:.2f}%)")
-        print(f"  Número de jogos: {len(self.best_individual.games):,} ({self.config.games_multiplier*100:.2f}% do mínimo teórico)")
+        if self.config.verbose:
+            print(f"Geração {self.generation}:")
+            print(f"  Melhor fitness: {self.best_individual.fitness:.2f}")
+            print(f"  Método: {self.best_individual.creation_method}")
+            print(f"  Trincas cobertas: {popcount(self.best_individual.trincas_mask):,} ({self.best_individual.get_trincas_coverage()*100:.2f}%)")
+            print(f"  Número de jogos: {len(self.best_individual.games):,} ({self.config.games_multiplier*100:.2f}% do mínimo teórico)")
         
         self.generation += 1
     
@@ -195,10 +328,11 @@ class Population:
         Returns:
             Lista dos melhores indivíduos.
         """
-        # Ordena os indivíduos por fitness (decrescente)
-        sorted_individuals = sorted(self.individuals, key=lambda ind: ind.fitness, reverse=True)
-        # Retorna os melhores indivíduos
-        return [ind.copy() for ind in sorted_individuals[:elite_size]]
+        # Seleciona os melhores indivíduos sem ordenar a população inteira
+        # (heapq.nlargest é estável: empates mantêm a ordem da população).
+        # Como os indivíduos da população nunca são alterados no lugar, eles
+        # podem ser compartilhados sem cópia
+        return heapq.nlargest(elite_size, self.individuals, key=lambda ind: ind.fitness)
     
     def __str__(self) -> str:
         """
@@ -31,3 +31,39 @@ def tournament_selection(population: 'Population', tournament_size: int = 5) ->
     
     # Retorna o indivíduo com maior fitness
     return max(tournament, key=lambda ind: ind.fitness) 
+
+
+def tournament_selection_pair(population: 'Population', tournament_size: int = 5,
+                              rng=random) -> Tuple[Individual, Individual]:
+    """
+    Seleciona dois indivíduos distintos por torneio, sem laço de rejeição.
+    
+    Os participantes dos dois torneios são sorteados de uma só vez entre os
+    indivíduos distintos da população e divididos ao meio, então os
+    vencedores são sempre indivíduos diferentes.
+    
+    Args:
+        population: A população de indivíduos.
+        tournament_size: Número de indivíduos que participam de cada torneio.
+        rng: Gerador aleatório usado no sorteio (padrão: o módulo random).
+        
+    Returns:
+        Tupla com os vencedores dos dois torneios.
+        
+    Raises:
+        ValueError: Se a população tiver menos de dois indivíduos distintos.
+    """
+    # A mesma instância pode aparecer mais de uma vez na população (um pai
+    # mantido no lugar de dois filhos, por exemplo)
+    individuals = list({id(ind): ind for ind in population.individuals}.values())
+    if len(individuals) < 2:
+        raise ValueError("A população precisa de pelo menos dois indivíduos distintos")
+    
+    tournament_size = max(1, min(tournament_size, len(individuals) // 2))
+    
+    # Seleciona aleatoriamente os participantes dos dois torneios
+    competitors = rng.sample(individuals, 2 * tournament_size)
+    
+    # Retorna o indivíduo com maior fitness de cada metade
+    return (max(competitors[:tournament_size], key=lambda ind: ind.fitness),
+            max(competitors[tournament_size:], key=lambda ind: ind.fitness))
@@ -3,8 +3,7 @@ Geração de combinações de 3 números (trincas) para o algoritmo genético.
 """
 
 import itertools
-import time
-from typing import Set, Tuple
+from typing import Dict, List, Set, Tuple
 
 
 def generate_all_trincas(min_num: int = 1, max_num: int = 60) -> Set[Tuple[int, int, int]]:
@@ -20,13 +19,74 @@ def generate_all_trincas(min_num: int = 1, max_num: int = 60) -> Set[Tuple[int,
         Cada trinca é representada como uma tupla de 3 números ordenados.
     """
     all_numbers = range(min_num, max_num + 1)
-    result = {tuple(sorted(combo)) for combo in itertools.combinations(all_numbers, 3)}
-    return result
+    # combinations de uma sequência ordenada já produz tuplas ordenadas
+    return set(itertools.combinations(all_numbers, 3))
 
 
 # Gera todas as trincas possíveis uma única vez
 TRINCAS = generate_all_trincas()
 
+# Identificadores inteiros das trincas, atribuídos em ordem lexicográfica.
+# Conjuntos de inteiros pequenos são bem mais baratos de comparar e combinar
+# do que conjuntos de tuplas. combinations já gera as trincas nessa ordem,
+# então não é preciso ordenar o conjunto TRINCAS.
+TRINCAS_BY_ID: List[Tuple[int, int, int]] = list(itertools.combinations(range(1, 61), 3))
+TRINCA_IDS: Dict[Tuple[int, int, int], int] = dict(zip(TRINCAS_BY_ID, itertools.count()))
+ALL_TRINCA_IDS = frozenset(TRINCA_IDS.values())
+
+# Número total de trincas, C(60, 3)
+TOTAL_TRINCAS = len(TRINCAS_BY_ID)
+
+# Maior número sorteável; as trincas usam os números de 1 a _MAX_NUM
+_MAX_NUM = 60
+
+
+def _pair_offset(a: int, b: int) -> int:
+    """
+    Calcula o deslocamento do par (a, b) pela fórmula combinatória (combinadic).
+    
+    Em ordem lexicográfica, há C(60, 3) - C(61 - a, 3) trincas com primeiro
+    número menor que a e, entre as que começam por a, C(60 - a, 2) -
+    C(61 - b, 2) com segundo número menor que b. Somando c - b - 1, obtém-se
+    o identificador de (a, b, c); o deslocamento é esse valor sem o termo c.
+    """
+    def comb2(n: int) -> int:
+        return n * (n - 1) // 2
+    
+    def comb3(n: int) -> int:
+        return n * (n - 1) * (n - 2) // 6
+    
+    return (comb3(_MAX_NUM) - comb3(_MAX_NUM + 1 - a)
+            + comb2(_MAX_NUM - a) - comb2(_MAX_NUM + 1 - b) - b - 1)
+
+
+# Deslocamento por par (a, b): id(a, b, c) == _PAIR_OFFSETS[(a << 6) | b] + c.
+# Em ordem lexicográfica as trincas de um mesmo par têm ids consecutivos em c,
+# então o id sai de um acesso a lista e uma soma, sem hashear a tupla.
+_PAIR_OFFSETS: List[int] = [0] * (1 << 12)
+for _a, _b in itertools.combinations(range(1, _MAX_NUM + 1), 2):
+    _PAIR_OFFSETS[(_a << 6) | _b] = _pair_offset(_a, _b)
+del _a, _b
+
+
+def trinca_id(a: int, b: int, c: int) -> int:
+    """
+    Retorna o identificador da trinca (a, b, c), com a < b < c.
+    
+    Equivale a TRINCA_IDS[(a, b, c)], mas é calculado sem hashear a tupla.
+    """
+    return _PAIR_OFFSETS[(a << 6) | b] + c
+
+
+# Bitset com todas as trincas: o bit i corresponde à trinca de identificador i
+ALL_TRINCAS_MASK = (1 << TOTAL_TRINCAS) - 1
+
+# Número de bytes de um bitset com todas as trincas
+_MASK_BYTES = (TOTAL_TRINCAS + 7) // 8
+
+# Converte os caracteres '0'/'1' de format(mask, 'b') em bytes 0/1
+_BIT_TABLE = bytes.maketrans(b"01", b"\x00\x01")
+
 
 def extract_trincas_from_game(game: list) -> Set[Tuple[int, int, int]]:
     """
@@ -38,7 +98,7 @@ def extract_trincas_from_game(game: list) -> Set[Tuple[int, int, int]]:
     Returns:
         Um conjunto de trincas encontradas no jogo.
     """
-    return {tuple(sorted(combo)) for combo in itertools.combinations(sorted(game), 3)}
+    return set(itertools.combinations(sorted(game), 3))
 
 
 def extract_trincas_from_games(games: list) -> Set[Tuple[int, int, int]]:
@@ -51,7 +111,115 @@ def extract_trincas_from_games(games: list) -> Set[Tuple[int, int, int]]:
     Returns:
         Um conjunto de todas as trincas únicas encontradas nos jogos.
     """
-    all_trincas = set()
-    for game in games:
-        all_trincas.update(extract_trincas_from_game(game))
-    return all_trincas 
+    return set().union(*map(extract_trincas_from_game, games))
+
+
+def extract_trinca_ids_from_game(game: list) -> Set[int]:
+    """
+    Extrai os identificadores das trincas de um jogo.
+    
+    Args:
+        game: Lista de números que compõem o jogo (normalmente 6 números).
+        
+    Returns:
+        Um conjunto com os identificadores (ver TRINCA_IDS) das trincas do jogo.
+    """
+    offsets = _PAIR_OFFSETS
+    numbers = sorted(game)
+    if len(numbers) != 6:
+        return {
+            offsets[(a << 6) | b] + c
+            for a, b, c in itertools.combinations(numbers, 3)
+        }
+
+    # Jogo de 6 números: as 20 trincas são escritas por extenso, somando o
+    # terceiro número ao deslocamento de cada um dos 10 pares que a iniciam
+    a, b, c, d, e, f = numbers
+    ab = offsets[(a << 6) | b]
+    ac = offsets[(a << 6) | c]
+    ad = offsets[(a << 6) | d]
+    ae = offsets[(a << 6) | e]
+    bc = offsets[(b << 6) | c]
+    bd = offsets[(b << 6) | d]
+    be = offsets[(b << 6) | e]
+    cd = offsets[(c << 6) | d]
+    ce = offsets[(c << 6) | e]
+    de = offsets[(d << 6) | e]
+    return {
+        ab + c, ab + d, ab + e, ab + f, ac + d, ac + e, ac + f, ad + e, ad + f, ae + f,
+        bc + d, bc + e, bc + f, bd + e, bd + f, be + f, cd + e, cd + f, ce + f, de + f,
+    }
+
+
+def extract_trinca_ids_from_games(games: list) -> Set[int]:
+    """
+    Extrai os identificadores das trincas de uma lista de jogos.
+    
+    Args:
+        games: Lista de jogos, onde cada jogo é uma lista de números.
+        
+    Returns:
+        Um conjunto com os identificadores de todas as trincas únicas dos jogos.
+    """
+    return set().union(*map(extract_trinca_ids_from_game, games))
+
+
+def game_to_mask(game: list) -> int:
+    """
+    Codifica um jogo como uma máscara de bits (bit n ligado para o número n).
+    
+    Args:
+        game: Lista de números que compõem o jogo.
+        
+    Returns:
+        Inteiro com um bit ligado para cada número do jogo.
+    """
+    mask = 0
+    for num in game:
+        mask |= 1 << num
+    return mask
+
+
+def _popcount_fallback(value: int) -> int:
+    """Conta os bits ligados de um inteiro não negativo (Python < 3.10)."""
+    return bin(value).count("1")
+
+
+# int.bit_count (Python 3.10+) vira uma única instrução POPCNT
+popcount = getattr(int, "bit_count", _popcount_fallback)
+
+
+def trinca_ids_to_mask(trinca_ids) -> int:
+    """
+    Codifica identificadores de trincas como um bitset.
+    
+    Args:
+        trinca_ids: Identificadores (ver TRINCA_IDS) das trincas.
+        
+    Returns:
+        Inteiro com o bit i ligado para cada trinca de identificador i.
+    """
+    # Os bits são ligados num buffer de bytes e convertidos para int de uma só
+    # vez (em C), em tempo linear; um OU de inteiros 1 << t cresceria com o
+    # tamanho do bitset a cada trinca
+    buffer = bytearray(_MASK_BYTES)
+    for trinca_id in trinca_ids:
+        buffer[trinca_id >> 3] |= 1 << (trinca_id & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def mask_to_trinca_ids(mask: int) -> List[int]:
+    """
+    Decodifica um bitset de trincas nos identificadores correspondentes.
+    
+    A varredura dos bits é feita inteiramente em C (format, translate e
+    itertools.compress), sem um laço em Python por bit.
+    
+    Args:
+        mask: Bitset produzido por trinca_ids_to_mask.
+        
+    Returns:
+        Lista com os identificadores das trincas presentes, em ordem crescente.
+    """
+    bits = format(mask, 'b')[::-1].encode().translate(_BIT_TABLE)
+    return list(itertools.compress(range(len(bits)), bits))
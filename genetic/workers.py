@@ -0,0 +1,103 @@
+"""
+Execução de operadores genéticos com sementes próprias, no processo atual ou
+em processos de trabalho.
+
+Cada tarefa leva uma semente sorteada no processo principal, e o operador que
+a executa usa um gerador criado a partir dela. Assim o resultado não depende
+de qual processo executa qual tarefa, nem de a execução ser sequencial ou
+paralela, e o gerador global do módulo random nunca é ressemeado.
+"""
+
+import copy
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence, Type, TypeVar
+
+from genetic.config import Config
+
+T = TypeVar('T')
+
+# Operadores de cada processo de trabalho, indexados pela classe e criados uma
+# única vez pelo inicializador do pool em vez de serem serializados a cada tarefa
+_worker_operators: Dict[type, object] = {}
+
+
+def init_worker(config: Config, operator_types: Sequence[type]) -> None:
+    """
+    Inicializa os operadores de um processo de trabalho (inicializador do pool).
+
+    Args:
+        config: Configuração do algoritmo.
+        operator_types: Classes dos operadores a criar (por exemplo, Crossover
+            e Mutation).
+    """
+    for operator_type in operator_types:
+        _worker_operators[operator_type] = operator_type(config)
+
+
+def worker_operator(operator_type: Type[T]) -> T:
+    """Retorna o operador da classe dada criado por init_worker neste processo."""
+    return _worker_operators[operator_type]
+
+
+def with_rng(operator: T, rng) -> T:
+    """
+    Retorna uma cópia rasa do operador que usa o gerador aleatório dado.
+
+    O operador original não é alterado; as tabelas pré-calculadas dele são
+    compartilhadas com a cópia, que custa apenas a cópia dos atributos.
+
+    Args:
+        operator: Operador com um atributo rng (Crossover ou Mutation).
+        rng: Gerador aleatório da tarefa.
+    """
+    operator = copy.copy(operator)
+    operator.rng = rng
+    return operator
+
+
+class WorkerPool:
+    """
+    Pool de processos de trabalho mantido entre chamadas.
+    
+    O pool é criado na primeira chamada a get e reaproveitado nas seguintes,
+    para que os processos (e os operadores criados por init_worker) não sejam
+    recriados a cada lote de tarefas. Um novo pool só é criado se o número de
+    processos mudar.
+    
+    Encerre o pool com close(); se isso não for feito, os processos são
+    encerrados quando o WorkerPool for coletado ou ao fim do interpretador.
+    """
+    
+    def __init__(self, config: Config, operator_types: Sequence[type]):
+        """
+        Args:
+            config: Configuração usada para criar os operadores dos processos.
+            operator_types: Classes dos operadores criados em cada processo.
+        """
+        self.config = config
+        self.operator_types = tuple(operator_types)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._workers = 0
+        self._finalizer: Optional[weakref.finalize] = None
+    
+    def get(self, n_workers: int) -> ProcessPoolExecutor:
+        """Retorna o pool com n_workers processos, criando-o se necessário."""
+        if self._executor is not None and self._workers != n_workers:
+            self.close()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=n_workers,
+                                                 initializer=init_worker,
+                                                 initargs=(self.config, self.operator_types))
+            self._workers = n_workers
+            # Garante o encerramento dos processos mesmo sem uma chamada a close
+            self._finalizer = weakref.finalize(self, self._executor.shutdown)
+        return self._executor
+    
+    def close(self) -> None:
+        """Encerra o pool de processos, se existir."""
+        if self._executor is not None:
+            self._finalizer()
+            self._finalizer = None
+            self._executor = None
+            self._workers = 0
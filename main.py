@@ -8,12 +8,15 @@ com um número mínimo de jogos.
 """
 
 import argparse
+import copy
+import inspect
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List
 import traceback
 
 from genetic.config import Config
 from genetic.population import Population
+from genetic.trincas import TOTAL_TRINCAS, popcount
 
 
 def parse_arguments():
@@ -64,9 +67,69 @@ def parse_arguments():
         help='Multiplicador para o número de jogos (default: 1.5)'
     )
     
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Não exibe o progresso de cada geração'
+    )
+    
+    parser.add_argument(
+        '--config',
+        action='append',
+        metavar='CHAVE=VALOR[,CHAVE=VALOR...]',
+        help='Executa o algoritmo com os parâmetros dados sobre a configuração '
+             'base; pode ser repetido para executar várias configurações em '
+             'sequência no mesmo processo (ex.: --config mutation_rate=0.1 '
+             '--config mutation_rate=0.2,elite_size=3)'
+    )
+    
     return parser.parse_args()
 
 
+# Parâmetros de Config que podem ser sobrescritos por --config
+_CONFIG_PARAMETERS = frozenset(inspect.signature(Config.__init__).parameters) - {'self'}
+
+
+def apply_config_overrides(config: Config, spec: str) -> Config:
+    """
+    Cria uma cópia da configuração com os parâmetros de spec sobrescritos.
+    
+    Args:
+        config: Configuração base (não é alterada).
+        spec: Parâmetros no formato "chave=valor[,chave=valor...]", com as
+            chaves iguais aos atributos de Config.
+        
+    Returns:
+        A nova configuração.
+        
+    Raises:
+        ValueError: Se um parâmetro estiver mal formatado, não existir ou
+            não for um número/booleano.
+    """
+    new_config = copy.copy(config)
+    for item in spec.split(','):
+        key, sep, value = item.partition('=')
+        key = key.strip()
+        value = value.strip()
+        if not sep or not key:
+            raise ValueError(f"Parâmetro inválido: '{item}' (esperado chave=valor)")
+        if key not in _CONFIG_PARAMETERS:
+            raise ValueError(f"Parâmetro desconhecido: '{key}'")
+        
+        # Converte o valor para o tipo do valor atual do parâmetro
+        current = getattr(config, key)
+        if isinstance(current, bool):
+            converted = value.lower() in ('1', 'true', 'sim', 'yes')
+        elif isinstance(current, int) or (current is None and value.lstrip('-').isdigit()):
+            converted = int(value)
+        elif isinstance(current, float) or current is None:
+            converted = float(value)
+        else:
+            raise ValueError(f"Parâmetro não pode ser sobrescrito: '{key}'")
+        setattr(new_config, key, converted)
+    return new_config
+
+
 def print_header():
     """Imprime o cabeçalho do programa"""
     print("=" * 60)
@@ -114,21 +177,22 @@ def run_genetic_algorithm(config: Config = None) -> None:
         print("Iniciando algoritmo genético...")
         print()
         
-        # Cria e inicializa população
-        population = Population(config)
-        population._initialize_population()
-        
-        # Loop principal do algoritmo
-        for generation in range(config.max_generations):
-            # Evolui a população
-            population.evolve()
+        # Cria e inicializa população; o bloco with encerra os processos de
+        # trabalho usados na geração dos filhos
+        with Population(config) as population:
+            population._initialize_population()
             
-            # Verifica se atingiu critério de parada
-            best = population.get_best()
-            if best.get_trincas_coverage() >= 0.99:
-                print("\nCritério de parada atingido!")
-                print(f"Cobertura de trincas: {best.get_trincas_coverage()*100:.2f}%")
-                break
+            # Loop principal do algoritmo
+            for generation in range(config.max_generations):
+                # Evolui a população
+                population.evolve()
+                
+                # Verifica se atingiu critério de parada
+                best = population.get_best()
+                if best.get_trincas_coverage() >= 0.99:
+                    print("\nCritério de parada atingido!")
+                    print(f"Cobertura de trincas: {best.get_trincas_coverage()*100:.2f}%")
+                    break
         
         # Exibe resultados finais
         end_time = time.time()
@@ -168,7 +232,7 @@ def print_results(results: Dict[str, Any]) -> None:
     
     print(f"\nMelhor solução encontrada:")
     print(f"  Número de jogos: {len(best.games)}")
-    print(f"  Trincas cobertas: {len(best.trincas)} de {len(best.all_trincas)}")
+    print(f"  Trincas cobertas: {popcount(best.trincas_mask)} de {TOTAL_TRINCAS}")
     print(f"  Cobertura: {best.get_trincas_coverage() * 100:.2f}%")
     print(f"  Redundância: {best.get_trincas_redundancy():.2f}")
     print(f"  Fitness: {best.fitness:.2f}")
@@ -201,16 +265,26 @@ def main() -> None:
             config.elite_size = args.elite_size
         if args.games_multiplier != 1.5:
             config.games_multiplier = args.games_multiplier
+        if args.quiet:
+            config.verbose = False
         
-        print("=" * 60)
-        print("ALGORITMO GENÉTICO PARA OTIMIZAÇÃO DE JOGOS DA LOTERIA")
-        print("=" * 60)
-        print(f"\nConfigurações:")
-        print(config)
-        print("\nIniciando algoritmo genético...\n")
+        # Com --config, executa cada conjunto de parâmetros em sequência no
+        # mesmo processo: as tabelas de trincas, construídas na importação,
+        # são reaproveitadas entre as execuções
+        configs: List[Config] = [config]
+        if args.config:
+            configs = [apply_config_overrides(config, spec) for spec in args.config]
         
-        # Run the genetic algorithm
-        run_genetic_algorithm(config)
+        for run_config in configs:
+            print("=" * 60)
+            print("ALGORITMO GENÉTICO PARA OTIMIZAÇÃO DE JOGOS DA LOTERIA")
+            print("=" * 60)
+            print(f"\nConfigurações:")
+            print(run_config)
+            print("\nIniciando algoritmo genético...\n")
+            
+            # Run the genetic algorithm
+            run_genetic_algorithm(run_config)
     except Exception as e:
         print(f"ERRO FATAL: {str(e)}")
         traceback.print_exc()
@@ -1,32 +1,49 @@
+from collections import Counter
 from typing import List
 
 class GeneticAlgorithm:
     def _find_redundant_games(self, games: List[List[int]]) -> List[int]:
         """Encontra jogos redundantes em uma lista de jogos.
         
+        Um jogo é redundante se todos os seus números estão em outro jogo.
+        
         Args:
             games: Lista de jogos para analisar
             
         Returns:
             Lista de índices dos jogos que são redundantes
         """
+        # Representa cada jogo como uma máscara de bits dos seus números; o
+        # jogo i está contido no jogo j quando mask_i & ~mask_j == 0
+        masks = []
+        for game in games:
+            mask = 0
+            for num in game:
+                mask |= 1 << num
+            masks.append(mask)
+        
+        # Jogos iguais são redundantes entre si
+        counts = Counter(masks)
+        
+        # Agrupa as máscaras distintas pelo número de elementos: um jogo só
+        # pode estar contido, sem ser igual, em um jogo com mais números
+        by_size = {}
+        for mask in counts:
+            by_size.setdefault(bin(mask).count("1"), []).append(mask)
+        
         redundant_indices = []
         
         # Para cada jogo
-        for i in range(len(games)):
-            game_i = games[i]
-            is_redundant = False
-            
-            # Compara com todos os outros jogos
-            for j in range(len(games)):
-                if i != j:
-                    game_j = games[j]
-                    # Verifica se todos os números do jogo i estão no jogo j
-                    if all(num in game_j for num in game_i):
-                        is_redundant = True
-                        break
+        for i, mask_i in enumerate(masks):
+            if counts[mask_i] > 1:
+                redundant_indices.append(i)
+                continue
             
-            if is_redundant:
+            # Compara apenas com os jogos maiores
+            size_i = bin(mask_i).count("1")
+            if any(mask_i & ~mask_j == 0
+                   for size, group in by_size.items() if size > size_i
+                   for mask_j in group):
                 redundant_indices.append(i)
         
         return redundant_indices 
@@ -0,0 +1,56 @@
+"""
+Testes para a configuração do algoritmo genético.
+"""
+
+import copy
+import pickle
+import unittest
+
+from genetic.config import Config
+
+
+class TestConfig(unittest.TestCase):
+    """Testes para os pesos do fitness da configuração."""
+
+    def test_fitness_weights_default(self):
+        """Os pesos padrão também ficam disponíveis como atributos simples."""
+        config = Config()
+        self.assertEqual(config.w_trincas, 1000)
+        self.assertEqual(config.w_penalty, 1)
+        self.assertEqual(dict(config.fitness_weights),
+                         {'trincas_coverage': 1000, 'games_penalty': 1})
+
+    def test_fitness_weights_read_only(self):
+        """Alterar os pesos no lugar falha em vez de ser ignorado."""
+        config = Config()
+        with self.assertRaises(TypeError):
+            config.fitness_weights['games_penalty'] = 99
+        self.assertEqual(config.w_penalty, 1)
+
+    def test_fitness_weights_assignment(self):
+        """Atribuir um novo dicionário atualiza os atributos de peso."""
+        weights = {'trincas_coverage': 10, 'games_penalty': 3}
+        config = Config(fitness_weights=weights)
+        self.assertEqual((config.w_trincas, config.w_penalty), (10, 3))
+        
+        # O dicionário original não fica ligado à configuração
+        weights['games_penalty'] = 99
+        self.assertEqual(config.fitness_weights['games_penalty'], 3)
+        
+        config.fitness_weights = {'trincas_coverage': 5, 'games_penalty': 2}
+        self.assertEqual((config.w_trincas, config.w_penalty), (5, 2))
+
+    def test_copy_and_pickle(self):
+        """Cópias e configurações serializadas mantêm os pesos somente leitura."""
+        config = Config(fitness_weights={'trincas_coverage': 7, 'games_penalty': 2})
+        for clone in (copy.copy(config), copy.deepcopy(config),
+                      pickle.loads(pickle.dumps(config))):
+            self.assertEqual(dict(clone.fitness_weights),
+                             {'trincas_coverage': 7, 'games_penalty': 2})
+            self.assertEqual((clone.w_trincas, clone.w_penalty), (7, 2))
+            with self.assertRaises(TypeError):
+                clone.fitness_weights['games_penalty'] = 99
+
+
+if __name__ == '__main__':
+    unittest.main()
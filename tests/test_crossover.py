@@ -0,0 +1,55 @@
+"""
+Testes para os operadores de crossover.
+"""
+
+import random
+import unittest
+
+from genetic.config import Config
+from genetic.crossover import Crossover, MIN_PARALLEL_PAIRS
+from genetic.individual import Individual
+
+
+class TestCrossoverBatch(unittest.TestCase):
+    """Testes para Crossover.crossover_batch."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config = Config(verbose=False)
+        rng = random.Random(3)
+        individuals = [Individual(config=cls.config).generate_random(num_games=150, rng=rng)
+                       for _ in range(2 * MIN_PARALLEL_PAIRS)]
+        cls.pairs = list(zip(individuals[::2], individuals[1::2]))
+
+    def _batch(self, max_workers):
+        """Executa crossover_batch com uma semente fixa e retorna os jogos dos filhos."""
+        crossover = Crossover(Config(verbose=False, seed=11))
+        try:
+            children = crossover.crossover_batch(self.pairs, method='crossover_by_trincas',
+                                                 max_workers=max_workers)
+        finally:
+            crossover.close()
+        return [(child1.games, child2.games) for child1, child2 in children]
+
+    def test_sequential_and_parallel_match(self):
+        """Com a mesma semente, o resultado não depende do número de processos."""
+        sequential = self._batch(max_workers=1)
+        self.assertEqual(len(sequential), len(self.pairs))
+        self.assertEqual(sequential, self._batch(max_workers=2))
+
+    def test_pool_is_reused(self):
+        """O pool de processos é mantido entre chamadas e encerrado por close()."""
+        crossover = Crossover(Config(verbose=False, seed=11))
+        try:
+            crossover.crossover_batch(self.pairs, max_workers=2)
+            executor = crossover._pool._executor
+            self.assertIsNotNone(executor)
+            crossover.crossover_batch(self.pairs, max_workers=2)
+            self.assertIs(crossover._pool._executor, executor)
+        finally:
+            crossover.close()
+        self.assertIsNone(crossover._pool._executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Testes para a atualização incremental das trincas de um indivíduo.
+"""
+
+import itertools
+import random
+import unittest
+from collections import Counter
+
+from genetic.config import Config
+from genetic.individual import Individual
+from genetic.trincas import extract_trinca_ids_from_game
+
+
+def _full_state(games):
+    """Bitset, contagens e lista de trincas calculados do zero para os jogos."""
+    reference = Individual(Config(verbose=False), jogos=list(games))
+    reference.calculate_trincas()
+    trincas_list = list(itertools.chain.from_iterable(
+        sorted(extract_trinca_ids_from_game(game)) for game in games))
+    counts = Counter(trincas_list)
+    return reference.trincas_mask, counts, trincas_list
+
+
+class TestIndividualSwapGame(unittest.TestCase):
+    """Testes para swap_game, get_trinca_counts e copy."""
+
+    def setUp(self):
+        self.rng = random.Random(5)
+        self.individual = Individual(Config(verbose=False)).generate_random(num_games=60, rng=self.rng)
+        # Jogo repetido: a trinca só deixa de ser coberta quando as duas cópias saem
+        self.individual.games.append(self.individual.games[0])
+        self.individual.calculate_trincas()
+        # Monta as estruturas mantidas de forma incremental por swap_game
+        self.individual.get_trinca_counts()
+        self.individual.trincas_list
+
+    def assertConsistent(self, individual):
+        """Compara o estado incremental do indivíduo com um recálculo completo."""
+        mask, counts, trincas_list = _full_state(individual.games)
+        self.assertEqual(individual.trincas_mask, mask)
+        self.assertEqual(dict(individual.get_trinca_counts()), dict(counts))
+        # A ordem das trincas dentro do bloco de cada jogo não é garantida
+        blocks = [sorted(individual.trincas_list[i:i + 20])
+                  for i in range(0, len(individual.trincas_list), 20)]
+        self.assertEqual(list(itertools.chain.from_iterable(blocks)), trincas_list)
+
+    def _swap_random_games(self, individual, count):
+        for _ in range(count):
+            idx = self.rng.randrange(len(individual.games))
+            # Às vezes reinsere um jogo já existente no indivíduo
+            if self.rng.random() < 0.2:
+                new_game = self.rng.choice(individual.games)
+            else:
+                new_game = tuple(sorted(self.rng.sample(range(1, 61), 6)))
+            lost = individual.swap_game(idx, new_game)
+            for trinca in lost:
+                self.assertFalse((individual.trincas_mask >> trinca) & 1)
+
+    def test_swap_matches_full_recalculation(self):
+        """Após várias trocas, bitset, contagens e lista batem com o recálculo."""
+        self._swap_random_games(self.individual, 40)
+        self.assertConsistent(self.individual)
+
+    def test_swap_on_copy_keeps_original(self):
+        """Trocas na cópia (contagens compartilhadas) não alteram o original."""
+        original = self.individual
+        before = (list(original.games), original.trincas_mask,
+                  original.get_trinca_counts().copy(), list(original.trincas_list))
+        
+        clone = original.copy()
+        self._swap_random_games(clone, 40)
+        self.assertConsistent(clone)
+        
+        self.assertEqual(original.games, before[0])
+        self.assertEqual(original.trincas_mask, before[1])
+        self.assertEqual(original.get_trinca_counts(), before[2])
+        self.assertEqual(original.trincas_list, before[3])
+        self.assertConsistent(original)
+
+    def test_swap_on_original_keeps_copy(self):
+        """Trocas no original depois da cópia não alteram a cópia."""
+        clone = self.individual.copy()
+        games = list(clone.games)
+        mask = clone.trincas_mask
+        
+        self._swap_random_games(self.individual, 40)
+        self.assertConsistent(self.individual)
+        
+        self.assertEqual(clone.games, games)
+        self.assertEqual(clone.trincas_mask, mask)
+        self.assertConsistent(clone)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+Testes para a leitura dos parâmetros de linha de comando.
+"""
+
+import unittest
+
+from genetic.config import Config
+from main import apply_config_overrides
+
+
+class TestApplyConfigOverrides(unittest.TestCase):
+    """Testes para apply_config_overrides (opção --config)."""
+
+    def test_type_conversion(self):
+        """Os valores são convertidos para o tipo do valor atual do parâmetro."""
+        config = apply_config_overrides(
+            Config(), "population_size=50, mutation_rate=0.1,verbose=false,seed=7")
+        self.assertEqual(config.population_size, 50)
+        self.assertIsInstance(config.population_size, int)
+        self.assertEqual(config.mutation_rate, 0.1)
+        self.assertIsInstance(config.mutation_rate, float)
+        self.assertIs(config.verbose, False)
+        self.assertEqual(config.seed, 7)
+        self.assertIs(apply_config_overrides(Config(verbose=False), "verbose=true").verbose, True)
+
+    def test_float_parameter_accepts_integer_text(self):
+        """Um parâmetro float continua float mesmo com um valor inteiro."""
+        config = apply_config_overrides(Config(), "crossover_rate=1")
+        self.assertIsInstance(config.crossover_rate, float)
+
+    def test_base_config_unchanged(self):
+        """A configuração base não é alterada."""
+        base = Config()
+        config = apply_config_overrides(base, "population_size=50,verbose=false")
+        self.assertIsNot(config, base)
+        self.assertEqual(base.population_size, 10)
+        self.assertIs(base.verbose, True)
+
+    def test_invalid_specs(self):
+        """Parâmetros desconhecidos, sem '=' ou com valores inválidos falham com ValueError."""
+        for spec in ("unknown=1", "population_size", "=5", "population_size=abc",
+                     "fitness_weights=1"):
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    apply_config_overrides(Config(), spec)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Testes para os operadores de mutação.
+"""
+
+import itertools
+import math
+import random
+import unittest
+from collections import Counter
+
+from genetic.config import Config
+from genetic.individual import Individual
+from genetic.mutation import Mutation, _sampled_indices
+from genetic.trincas import extract_trinca_ids_from_game
+
+
+class TestMutateByRedundancy(unittest.TestCase):
+    """Testes para Mutation.mutate_by_redundancy."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config = Config(verbose=False, seed=1)
+        cls.mutation = Mutation(cls.config)
+
+    def _mutate(self, games):
+        """Aplica a mutação e verifica que a cobertura e as contagens continuam corretas."""
+        individual = Individual(self.config, jogos=list(games))
+        individual.calculate_trincas()
+        mask = individual.trincas_mask
+        
+        self.mutation.mutate_by_redundancy(individual)
+        
+        self.assertEqual(individual.trincas_mask, mask)
+        recount = Counter(itertools.chain.from_iterable(
+            extract_trinca_ids_from_game(game) for game in individual.games))
+        self.assertEqual(dict(individual.get_trinca_counts()), dict(recount))
+        return individual.games
+
+    def test_games_covering_each_other(self):
+        """Jogos que cobrem as trincas uns dos outros não são removidos juntos."""
+        # Os 7 jogos de 6 números tirados de 1 a 7: cada trinca está em 4 jogos,
+        # então todos são redundantes, mas não podem sair todos
+        games = list(itertools.combinations(range(1, 8), 6))
+        remaining = self._mutate(games)
+        self.assertLess(len(remaining), len(games))
+        self.assertTrue(remaining)
+
+    def test_duplicate_games(self):
+        """Apenas uma das cópias de um jogo repetido é removida."""
+        game = (1, 2, 3, 4, 5, 6)
+        other = (10, 20, 30, 40, 50, 60)
+        self.assertEqual(self._mutate([game, other, game]), [other, game])
+        self.assertEqual(self._mutate([game, game, game]), [game])
+
+    def test_unique_games_are_kept(self):
+        """Jogos com trincas exclusivas não são removidos."""
+        games = [(1, 2, 3, 4, 5, 6), (1, 2, 3, 7, 8, 9), (10, 20, 30, 40, 50, 60)]
+        self.assertEqual(self._mutate(games), games)
+
+
+class TestMutateBySmartReplacement(unittest.TestCase):
+    """Testes para Mutation.mutate_by_smart_replacement."""
+
+    def test_games_stay_tuples(self):
+        """Os jogos inseridos pela mutação são tuplas ordenadas, como os demais."""
+        config = Config(verbose=False, seed=2)
+        individual = Individual(config).generate_random(num_games=50, rng=random.Random(2))
+        mutation = Mutation(config, mutation_rate=1.0)
+        mutation.mutate_by_smart_replacement(individual)
+        for game in individual.games:
+            self.assertIsInstance(game, tuple)
+            self.assertEqual(list(game), sorted(set(game)))
+
+
+class TestSampledIndices(unittest.TestCase):
+    """Testes para o sorteio de índices com saltos geométricos."""
+
+    def test_edge_cases(self):
+        """Taxa 0 não sorteia nada, taxa 1 sorteia tudo e n=0 não gera índices."""
+        rng = random.Random(0)
+        self.assertEqual(list(_sampled_indices(100, 0.0, rng)), [])
+        self.assertEqual(list(_sampled_indices(100, 1.0, rng)), list(range(100)))
+        for rate in (0.0, 0.3, 1.0):
+            self.assertEqual(list(_sampled_indices(0, rate, rng)), [])
+
+    def test_indices_are_increasing_and_in_range(self):
+        """Os índices são crescentes, sem repetição e menores que n."""
+        indices = list(_sampled_indices(1000, 0.2, random.Random(1)))
+        self.assertEqual(indices, sorted(set(indices)))
+        self.assertTrue(all(0 <= i < 1000 for i in indices))
+
+    def test_seeded_sequence_is_reproducible(self):
+        """Com a mesma semente, o sorteio é o mesmo."""
+        self.assertEqual(list(_sampled_indices(500, 0.1, random.Random(42))),
+                         list(_sampled_indices(500, 0.1, random.Random(42))))
+
+    def test_distribution(self):
+        """Cada índice é sorteado com probabilidade rate."""
+        n, rate, trials = 200, 0.1, 2000
+        rng = random.Random(7)
+        hits = [0] * n
+        for _ in range(trials):
+            for i in _sampled_indices(n, rate, rng):
+                hits[i] += 1
+        
+        # Total de sorteios: média n * rate por rodada, com margem de 5 desvios-padrão
+        total = sum(hits)
+        expected = n * rate * trials
+        self.assertLess(abs(total - expected), 5 * math.sqrt(expected * (1 - rate)))
+        
+        # Sem viés de posição: primeira e segunda metades com frequências próximas
+        first_half = sum(hits[:n // 2])
+        self.assertLess(abs(2 * first_half - total), 5 * math.sqrt(total))
+
+
+if __name__ == '__main__':
+    unittest.main()
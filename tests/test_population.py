@@ -0,0 +1,75 @@
+"""
+Testes para a evolução da população.
+"""
+
+import contextlib
+import io
+import random
+import unittest
+
+from genetic.config import Config
+from genetic.crossover import Crossover
+from genetic.mutation import Mutation
+from genetic.population import Population, MIN_PARALLEL_FAMILIES
+from genetic.workers import init_worker
+
+
+def _snapshot(individuals):
+    """Estado observável de cada indivíduo: jogos, bitset de trincas e fitness."""
+    return [(list(ind.games), ind.trincas_mask, ind.fitness) for ind in individuals]
+
+
+class TestPopulationEvolve(unittest.TestCase):
+    """Testes para a geração paralela dos filhos em Population.evolve."""
+
+    def _config(self):
+        # Pares suficientes para que a geração dos filhos use o pool de processos
+        elite_size = 5
+        return Config(population_size=elite_size + 2 * MIN_PARALLEL_FAMILIES,
+                      elite_size=elite_size, games_multiplier=0.2,
+                      seed=7, verbose=False)
+
+    def _evolve(self, max_workers, generations=2):
+        """
+        Evolui uma população com semente fixa e retorna o estado final.
+        
+        A cada geração, verifica também que os pais não foram alterados.
+        """
+        with Population(self._config()) as population:
+            population._initialize_population(max_workers=1)
+            for _ in range(generations):
+                parents = list(population.individuals)
+                before = _snapshot(parents)
+                population.evolve(max_workers=max_workers)
+                self.assertEqual(_snapshot(parents), before)
+            return _snapshot(population.individuals)
+
+    def test_sequential_and_parallel_match(self):
+        """Com a mesma semente, evolve não depende do número de processos e não altera os pais."""
+        self.assertEqual(self._evolve(max_workers=1), self._evolve(max_workers=2))
+
+    def test_global_random_state_untouched(self):
+        """Uma população com semente não altera o gerador global do módulo random."""
+        random.seed(123)
+        state = random.getstate()
+        self._evolve(max_workers=1, generations=1)
+        self.assertEqual(random.getstate(), state)
+
+
+    def test_worker_startup_is_silent(self):
+        """A inicialização de um processo de reprodução não exibe nada, mesmo com verbose."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            init_worker(Config(verbose=True), (Crossover, Mutation))
+        self.assertEqual(output.getvalue(), "")
+
+
+    def test_operators_share_population_rng(self):
+        """Seleção, crossover e mutação usam o único gerador da população."""
+        with Population(self._config()) as population:
+            self.assertIs(population.crossover.rng, population.rng)
+            self.assertIs(population.mutation.rng, population.rng)
+
+
+if __name__ == '__main__':
+    unittest.main()
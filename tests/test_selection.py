@@ -0,0 +1,88 @@
+"""
+Testes para a seleção por torneio.
+"""
+
+import random
+import unittest
+from types import SimpleNamespace
+
+from genetic.individual import Individual
+from genetic.selection import tournament_selection_pair
+
+
+def _population(fitnesses):
+    """População mínima (apenas a lista de indivíduos) com os fitness dados."""
+    individuals = []
+    for fitness in fitnesses:
+        individual = Individual()
+        individual.fitness = fitness
+        individuals.append(individual)
+    return SimpleNamespace(individuals=individuals)
+
+
+class _RecordingRandom(random.Random):
+    """Gerador que registra o tamanho de cada amostra sorteada."""
+
+    def __init__(self, seed):
+        super().__init__(seed)
+        self.sample_sizes = []
+
+    def sample(self, population, k):
+        self.sample_sizes.append(k)
+        return super().sample(population, k)
+
+
+class TestTournamentSelectionPair(unittest.TestCase):
+    """Testes para tournament_selection_pair."""
+
+    def test_pair_is_distinct(self):
+        """Os dois vencedores são sempre indivíduos diferentes."""
+        population = _population(range(10))
+        rng = random.Random(0)
+        for _ in range(200):
+            parent1, parent2 = tournament_selection_pair(population, rng=rng)
+            self.assertIsNot(parent1, parent2)
+
+    def test_repeated_instances_are_deduplicated(self):
+        """Uma instância repetida na população conta como um único indivíduo."""
+        population = _population([1.0, 2.0])
+        first, second = population.individuals
+        population.individuals = [first, first, first, second]
+        rng = random.Random(0)
+        for _ in range(50):
+            pair = tournament_selection_pair(population, rng=rng)
+            self.assertEqual({id(ind) for ind in pair}, {id(first), id(second)})
+
+    def test_tournament_shrinks_for_small_populations(self):
+        """O torneio é limitado à metade dos indivíduos distintos (no mínimo 1)."""
+        for size, expected in ((2, 1), (3, 1), (5, 2), (10, 5), (30, 5)):
+            with self.subTest(size=size):
+                rng = _RecordingRandom(0)
+                tournament_selection_pair(_population(range(size)), tournament_size=5, rng=rng)
+                self.assertEqual(rng.sample_sizes, [2 * expected])
+
+    def test_two_individuals(self):
+        """Com dois indivíduos distintos, o par é formado pelos dois."""
+        population = _population([1.0, 2.0])
+        pair = tournament_selection_pair(population, rng=random.Random(0))
+        self.assertEqual({id(ind) for ind in pair}, {id(ind) for ind in population.individuals})
+
+    def test_fewer_than_two_distinct_individuals(self):
+        """Sem dois indivíduos distintos, a seleção falha com ValueError."""
+        single = _population([1.0])
+        repeated = SimpleNamespace(individuals=single.individuals * 3)
+        for population in (_population([]), single, repeated):
+            with self.assertRaises(ValueError):
+                tournament_selection_pair(population, rng=random.Random(0))
+
+    def test_winner_has_highest_fitness(self):
+        """Com todos os indivíduos nos torneios, o melhor sempre vence o seu torneio."""
+        population = _population([5.0, 1.0, 3.0, 4.0])
+        rng = random.Random(0)
+        for _ in range(20):
+            parent1, parent2 = tournament_selection_pair(population, tournament_size=2, rng=rng)
+            self.assertIn(5.0, (parent1.fitness, parent2.fitness))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,22 @@ Testes para o módulo de geração de trincas.
 """
 
 import unittest
-from genetic.trincas import generate_all_trincas, extract_trincas_from_game, extract_trincas_from_games
+from genetic.trincas import (
+    generate_all_trincas,
+    extract_trincas_from_game,
+    extract_trincas_from_games,
+    extract_trinca_ids_from_game,
+    extract_trinca_ids_from_games,
+    TRINCA_IDS,
+    TRINCAS_BY_ID,
+    TOTAL_TRINCAS,
+    trinca_id,
+    game_to_mask,
+    popcount,
+    trinca_ids_to_mask,
+    mask_to_trinca_ids,
+    ALL_TRINCAS_MASK,
+)
 
 
 class TestTrincas(unittest.TestCase):
@@ -61,6 +76,45 @@ class TestTrincas(unittest.TestCase):
         # Verifica trinca compartilhada
         self.assertIn((4, 5, 6), trincas)
 
+    def test_trinca_ids(self):
+        """Testa a correspondência entre trincas e seus identificadores."""
+        self.assertEqual(len(TRINCA_IDS), 34220)
+        self.assertEqual(TOTAL_TRINCAS, 34220)
+        self.assertEqual(TRINCA_IDS[(1, 2, 3)], 0)
+        self.assertEqual(TRINCA_IDS[(58, 59, 60)], 34219)
+        for trinca, expected_id in TRINCA_IDS.items():
+            self.assertEqual(TRINCAS_BY_ID[expected_id], trinca)
+            self.assertEqual(trinca_id(*trinca), expected_id)
+
+    def test_extract_trinca_ids(self):
+        """Testa a extração de identificadores de trincas de jogos."""
+        game = [42, 3, 27, 12, 57, 35]
+        ids = extract_trinca_ids_from_game(game)
+        self.assertEqual(ids, {TRINCA_IDS[t] for t in extract_trincas_from_game(game)})
+
+        games = [[1, 2, 3, 4, 5, 6], [4, 5, 6, 7, 8, 9]]
+        self.assertEqual(len(extract_trinca_ids_from_games(games)), 39)
+
+    def test_game_to_mask(self):
+        """Testa a codificação de jogos como máscaras de bits."""
+        mask1 = game_to_mask([1, 2, 3, 4, 5, 6])
+        mask2 = game_to_mask([4, 5, 6, 7, 8, 60])
+        self.assertEqual(mask1, 0b1111110)
+        self.assertEqual(popcount(mask1), 6)
+        # Números em comum: 4, 5 e 6
+        self.assertEqual(popcount(mask1 & mask2), 3)
+
+    def test_trinca_bitset(self):
+        """Testa a codificação de trincas como bitset e a decodificação."""
+        ids = extract_trinca_ids_from_games([[1, 2, 3, 4, 5, 6], [4, 5, 6, 7, 8, 9]])
+        mask = trinca_ids_to_mask(ids)
+        self.assertEqual(popcount(mask), 39)
+        self.assertEqual(mask_to_trinca_ids(mask), sorted(ids))
+        self.assertEqual(mask_to_trinca_ids(0), [])
+        self.assertEqual(popcount(ALL_TRINCAS_MASK), 34220)
+        # Trincas faltantes: complemento em relação a todas as trincas
+        self.assertEqual(len(mask_to_trinca_ids(ALL_TRINCAS_MASK & ~mask)), 34220 - 39)
+
 
 if __name__ == '__main__':
     unittest.main() 
@@ -4,12 +4,20 @@ Testes de performance para diferentes taxas de mutação.
 
 import pytest
 import random
-import time as time_module
+import statistics
+from time import perf_counter_ns
 from genetic.individual import Individual, calculate_fitness
 from genetic.mutation import Mutation
-from genetic.trincas import TRINCAS
+from genetic.trincas import popcount
 from genetic.config import Config
 
+# Semente base das tentativas; a tentativa i de cada taxa usa um gerador
+# random.Random(RATES_SEED + i)
+RATES_SEED = 42
+
+# Métricas registradas por tentativa, na ordem das colunas da tabela de médias
+METRIC_KEYS = ('times', 'trincas_changes', 'fitness_changes', 'games_changes')
+
 @pytest.fixture
 def config():
     return Config()
@@ -21,8 +29,8 @@ def mutation(config):
 @pytest.fixture
 def individual(config):
     individual = Individual(config=config)
+    # generate_random já calcula as trincas e o fitness
     individual.generate_random()
-    calculate_fitness(individual)
     return individual
 
 def test_mutation_rates_comparison(mutation, config):
@@ -40,40 +48,54 @@ def test_mutation_rates_comparison(mutation, config):
     print(f"\nExecutando {num_tests} iterações para cada taxa de mutação...")
     
     results = {
-        rate: {
-            'times': [],
-            'trincas_changes': [],
-            'fitness_changes': [],
-            'games_changes': []
-        }
+        rate: {key: [] for key in METRIC_KEYS}
         for rate in mutation_rates
     }
     
+    # Aquecimento fora da medição de tempo: a primeira mutação paga custos
+    # únicos (código ainda não executado) que distorceriam a média da primeira
+    # taxa. Cada tentativa fixa a sua semente, então o aquecimento não altera
+    # os resultados.
+    warmup = Individual(config=config).generate_random()
+    mutation.mutate_by_smart_replacement(warmup)
+    calculate_fitness(warmup)
+    
+    # O relatório de cada tentativa é acumulado e exibido de uma só vez ao
+    # final, para que a saída não se intercale com as medições
+    output = []
+    
     for rate in mutation_rates:
-        print(f"\n=== TESTANDO TAXA DE MUTAÇÃO: {rate} ===")
+        output.append(f"\n=== TESTANDO TAXA DE MUTAÇÃO: {rate} ===")
+        # A mesma instância de Mutation serve a todas as taxas; basta trocar
+        # a taxa uma vez por taxa testada
+        mutation.mutation_rate = rate
         
         for i in range(num_tests):
-            print(f"\nIteração {i+1}/{num_tests}")
+            output.append(f"\nIteração {i+1}/{num_tests}")
+            
+            # Semente fixa por tentativa: as taxas partem dos mesmos indivíduos e
+            # as execuções são reproduzíveis. O gerador é local, então o estado
+            # global do módulo random não é alterado
+            rng = random.Random(RATES_SEED + i)
+            mutation.rng = rng
             
             # Cria indivíduo para teste
             individual = Individual(config=config)
-            individual.generate_random()
-            calculate_fitness(individual)
+            individual.generate_random(rng=rng)  # Já calcula o fitness
             
             # Guarda métricas iniciais
-            initial_trincas = len(individual.trincas)
+            initial_trincas = popcount(individual.trincas_mask)
             initial_fitness = individual.fitness
             initial_games = len(individual.games)
             
             # Aplica mutação
-            mutation.mutation_rate = rate
-            start_time = time_module.time()
+            start_time = perf_counter_ns()
             mutation.mutate_by_smart_replacement(individual)
             calculate_fitness(individual)  # Recalcula o fitness após a mutação
-            end_time = time_module.time()
+            end_time = perf_counter_ns()
             
             # Calcula métricas finais
-            final_trincas = len(individual.trincas)
+            final_trincas = popcount(individual.trincas_mask)
             final_fitness = individual.fitness
             final_games = len(individual.games)
             
@@ -81,18 +103,20 @@ def test_mutation_rates_comparison(mutation, config):
             trincas_change = ((final_trincas - initial_trincas) / initial_trincas * 100)
             fitness_change = ((final_fitness - initial_fitness) / initial_fitness * 100)
             games_change = ((final_games - initial_games) / initial_games * 100)
-            execution_time = end_time - start_time
+            execution_ns = end_time - start_time
             
             # Armazena resultados
-            results[rate]['times'].append(execution_time)
+            results[rate]['times'].append(execution_ns)
             results[rate]['trincas_changes'].append(trincas_change)
             results[rate]['fitness_changes'].append(fitness_change)
             results[rate]['games_changes'].append(games_change)
             
-            print(f"Tempo: {execution_time:.2f}s")
-            print(f"Trincas: {initial_trincas} -> {final_trincas} ({trincas_change:.2f}%)")
-            print(f"Fitness: {initial_fitness:.2f} -> {final_fitness:.2f} ({fitness_change:.2f}%)")
-            print(f"Jogos: {initial_games} -> {final_games} ({games_change:.2f}%)")
+            output.append(f"Tempo: {execution_ns / 1e9:.4f}s")
+            output.append(f"Trincas: {initial_trincas} -> {final_trincas} ({trincas_change:.2f}%)")
+            output.append(f"Fitness: {initial_fitness:.2f} -> {final_fitness:.2f} ({fitness_change:.2f}%)")
+            output.append(f"Jogos: {initial_games} -> {final_games} ({games_change:.2f}%)")
+    
+    print("\n".join(output))
     
     # Calcula e exibe médias
     print("\n=== RESULTADOS MÉDIOS ===")
@@ -100,11 +124,13 @@ def test_mutation_rates_comparison(mutation, config):
     print("-" * 60)
     
     for rate in mutation_rates:
-        avg_time = sum(results[rate]['times']) / len(results[rate]['times'])
-        avg_trincas = sum(results[rate]['trincas_changes']) / len(results[rate]['trincas_changes'])
-        avg_fitness = sum(results[rate]['fitness_changes']) / len(results[rate]['fitness_changes'])
-        avg_games = sum(results[rate]['games_changes']) / len(results[rate]['games_changes'])
+        # Os tempos são inteiros em nanossegundos; statistics.mean os soma
+        # exatamente e só a média é convertida para segundos
+        avg_time, avg_trincas, avg_fitness, avg_games = (
+            statistics.mean(results[rate][key]) for key in METRIC_KEYS
+        )
+        avg_time /= 1e9
         
-        print(f"{rate:.2f}\t{avg_time:.2f}\t{avg_trincas:.2f}\t{avg_fitness:.2f}\t{avg_games:.2f}")
+        print(f"{rate:.2f}\t{avg_time:.4f}\t{avg_trincas:.2f}\t{avg_fitness:.2f}\t{avg_games:.2f}")
     
     print("\n=== FIM DO TESTE DE TAXAS DE MUTAÇÃO ===") 